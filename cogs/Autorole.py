@@ -1,18 +1,8 @@
 import discord
 import logging
-import yaml
-import datetime
 from discord.ext import commands
-
-
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    try:
-        with open("audit.log", "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
-    except Exception as e:
-        logging.error(f"Failed to write to audit.log: {e}")
+from utils.audit import audit_log
+from utils.config_cache import load_yaml_cached
 
 
 class AutoRole(commands.Cog):
@@ -126,12 +116,11 @@ class AutoRole(commands.Cog):
 
     def _load_config(self) -> dict:
         try:
-            with open(self.CONFIG_PATH, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-                if not isinstance(data, dict):
-                    logging.warning("config.yaml is not a dict; using defaults.")
-                    return {}
-                return data
+            data = load_yaml_cached(self.CONFIG_PATH) or {}
+            if not isinstance(data, dict):
+                logging.warning("config.yaml is not a dict; using defaults.")
+                return {}
+            return data
         except FileNotFoundError:
             logging.error("config.yaml not found. Using defaults in memory.")
             audit_log("AutoRole: config.yaml not found. Using defaults in memory.")
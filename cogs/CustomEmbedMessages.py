@@ -3,17 +3,7 @@ import discord
 import logging
 from discord import app_commands
 from discord.ext import commands
-from datetime import datetime
-
-
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    try:
-        with open("audit.log", "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
-    except Exception as e:
-        logging.error(f"Failed to write to audit.log: {e}")
+from utils.audit import audit_log
 
 
 def make_embed(title: str, description: str, color: discord.Color) -> discord.Embed:
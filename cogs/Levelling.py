@@ -2,6 +2,7 @@ import re
 import math
 import random
 import sqlite3
+import zlib
 import asyncio
 import discord
 import logging
@@ -9,6 +10,7 @@ from typing import Optional, Tuple, Dict, Any, List, Literal
 from discord import app_commands
 from discord.ext import commands
 from datetime import datetime
+from utils.audit import audit_log
 
 
 # ======================================================================================
@@ -16,16 +18,6 @@ from datetime import datetime
 # ======================================================================================
 
 
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    try:
-        with open("audit.log", "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
-    except Exception as e:
-        logging.error(f"Failed to write to audit.log: {e}")
-
-
 def make_embed(title: str, description: str, color: discord.Color) -> discord.Embed:
     return discord.Embed(title=title, description=description, color=color)
 
@@ -38,6 +30,7 @@ DB_PATH = "levels.db"
 
 conn = sqlite3.connect(DB_PATH, check_same_thread=False)
 conn.execute("PRAGMA journal_mode=WAL;")
+conn.execute("PRAGMA cache_size=-64000;")  # ~64 MB page cache
 conn.row_factory = sqlite3.Row
 cursor = conn.cursor()
 
@@ -60,11 +53,17 @@ cursor.execute(
         curve_a INTEGER NOT NULL DEFAULT 50,          -- used by linear and quadratic
         curve_b INTEGER NOT NULL DEFAULT 0,           -- reserved
         announce_level_up INTEGER NOT NULL DEFAULT 1,
-        announce_channel_id INTEGER
+        announce_channel_id INTEGER,
+        last_recalc_curve_hash INTEGER               -- fingerprint of the curve at the last /levelconfig recalc
     );
     """
 )
 
+# Migrate older databases created before last_recalc_curve_hash existed
+_settings_cols = [r[1] for r in cursor.execute("PRAGMA table_info(guild_settings)").fetchall()]
+if "last_recalc_curve_hash" not in _settings_cols:
+    cursor.execute("ALTER TABLE guild_settings ADD COLUMN last_recalc_curve_hash INTEGER")
+
 cursor.execute(
     """
     CREATE TABLE IF NOT EXISTS ignored_channels (
@@ -98,6 +97,11 @@ cursor.execute(
     """
 )
 
+# Covering index so guild-wide scans (recalc) are answered from the index alone
+cursor.execute(
+    "CREATE INDEX IF NOT EXISTS idx_user_xp_guild_covering ON user_xp(guild_id, user_id, xp, level)"
+)
+
 cursor.execute(
     """
     CREATE TABLE IF NOT EXISTS role_rewards (
@@ -113,6 +117,13 @@ conn.commit()
 
 _db_lock = asyncio.Lock()
 
+# Maximum number of members processed concurrently by /levelconfig recalc.
+# Keeps role-award API calls well inside Discord's global rate limit.
+RECALC_CONCURRENCY = 10
+
+# Rows fetched per chunk when /levelconfig recalc scans a guild's user_xp table.
+RECALC_FETCH_SIZE = 1000
+
 
 # ======================================================================================
 # Core maths for level curves
@@ -198,6 +209,15 @@ DEFAULT_SETTINGS = {
 }
 
 
+def curve_fingerprint(curve: str, base_xp: int, a: int, b: int) -> int:
+    """
+    Return a stable fingerprint of the curve parameters.
+    Uses crc32 rather than hash() so the value survives restarts.
+    """
+    key = repr((curve, base_xp, a, b))
+    return zlib.crc32(key.encode("utf-8"))
+
+
 async def get_settings(guild_id: int) -> Dict[str, Any]:
     async with _db_lock:
         row = cursor.execute(
@@ -446,6 +466,11 @@ async def set_role_reward(guild_id: int, level: int, role_id: int):
             "INSERT OR REPLACE INTO role_rewards (guild_id, level, role_id) VALUES (?, ?, ?)",
             (guild_id, level, role_id),
         )
+        # Any level config change lets the next /levelconfig recalc run
+        cursor.execute(
+            "UPDATE guild_settings SET last_recalc_curve_hash = NULL WHERE guild_id = ?",
+            (guild_id,),
+        )
         conn.commit()
 
 
@@ -455,6 +480,10 @@ async def remove_role_reward(guild_id: int, level: int):
             "DELETE FROM role_rewards WHERE guild_id = ? AND level = ?",
             (guild_id, level),
         )
+        cursor.execute(
+            "UPDATE guild_settings SET last_recalc_curve_hash = NULL WHERE guild_id = ?",
+            (guild_id,),
+        )
         conn.commit()
 
 
@@ -497,6 +526,18 @@ def bool_emoji(value: bool) -> str:
     return "✅" if value else "❌"
 
 
+def resolve_awarded_roles(
+    guild: discord.Guild, awarded: List[Tuple[int, int]]
+) -> List[Tuple[int, discord.Role]]:
+    """Map (level, role_id) pairs to (level, role), skipping roles that no longer exist."""
+    get_role = guild.get_role
+    return [
+        (lvl, role)
+        for lvl, role in ((lvl, get_role(rid)) for lvl, rid in awarded)
+        if role is not None
+    ]
+
+
 def format_progress_bar(progress: int, goal: int, length: int = 18) -> str:
     goal = max(goal, 1)
     progress = max(0, progress)
@@ -854,14 +895,10 @@ class LevelSystem(commands.Cog):
                             current_level,
                         )
                         progress = max(0, new_total - prev_req)
-                        reward_lines: List[str] = []
-                        if awarded:
-                            for lvl, rid in awarded:
-                                role = message.guild.get_role(rid)
-                                if role:
-                                    reward_lines.append(
-                                        f"Level {lvl} reward: {role.mention}"
-                                    )
+                        reward_lines = [
+                            f"Level {lvl} reward: {role.mention}"
+                            for lvl, role in resolve_awarded_roles(message.guild, awarded)
+                        ]
 
                         embed = create_level_up_embed(
                             message.author,
@@ -949,15 +986,15 @@ class LevelSystem(commands.Cog):
             )
         except Exception as e:
             logging.error(f"/level profile failed: {e}")
-            try:
-                await interaction.response.send_message(
+            if interaction.response.is_done():
+                await interaction.followup.send(
                     embed=create_standard_embed(
                         description="Failed to fetch profile."
                     ),
                     ephemeral=True,
                 )
-            except discord.InteractionResponded:
-                await interaction.followup.send(
+            else:
+                await interaction.response.send_message(
                     embed=create_standard_embed(
                         description="Failed to fetch profile."
                     ),
@@ -994,15 +1031,15 @@ class LevelSystem(commands.Cog):
             await interaction.response.send_message(embed=embed, view=view)
         except Exception as e:
             logging.error(f"/level leaderboard failed: {e}")
-            try:
-                await interaction.response.send_message(
+            if interaction.response.is_done():
+                await interaction.followup.send(
                     embed=create_standard_embed(
                         description="Failed to fetch leaderboard."
                     ),
                     ephemeral=True,
                 )
-            except discord.InteractionResponded:
-                await interaction.followup.send(
+            else:
+                await interaction.response.send_message(
                     embed=create_standard_embed(
                         description="Failed to fetch leaderboard."
                     ),
@@ -1041,10 +1078,11 @@ class LevelSystem(commands.Cog):
         bl_roles = await list_blacklisted_roles(interaction.guild.id)
         rewards = await list_role_rewards(interaction.guild.id)
 
+        get_role = interaction.guild.get_role
         ch_mentions = [f"<#{cid}>" for cid in ignored] or ["None"]
         role_mentions = []
         for rid in bl_roles:
-            role = interaction.guild.get_role(rid)
+            role = get_role(rid)
             role_mentions.append(role.mention if role else f"`{rid}`")
         role_mentions = role_mentions or ["None"]
 
@@ -1053,7 +1091,7 @@ class LevelSystem(commands.Cog):
         for r in rewards:
             level = int(r["level"])
             role_id = int(r["role_id"])
-            role = interaction.guild.get_role(role_id)
+            role = get_role(role_id)
             if role:
                 reward_lines.append(f"Level {level} → {role.mention}")
             else:
@@ -1102,7 +1140,7 @@ class LevelSystem(commands.Cog):
                 ephemeral=True,
             )
         await update_settings(
-            interaction.guild.id, xp_min=int(xp_min), xp_max=int(xp_max)
+            interaction.guild.id, xp_min=xp_min, xp_max=xp_max
         )
         await interaction.response.send_message(
             embed=discord.Embed(
@@ -1121,7 +1159,7 @@ class LevelSystem(commands.Cog):
         interaction: discord.Interaction,
         seconds: app_commands.Range[int, 0, 86400],
     ):
-        await update_settings(interaction.guild.id, cooldown_seconds=int(seconds))
+        await update_settings(interaction.guild.id, cooldown_seconds=seconds)
         await interaction.response.send_message(
             embed=discord.Embed(
                 description=f"Cooldown set to {seconds} seconds."
@@ -1155,7 +1193,7 @@ class LevelSystem(commands.Cog):
         interaction: discord.Interaction,
         min_chars: app_commands.Range[int, 0, 4000],
     ):
-        await update_settings(interaction.guild.id, min_chars=int(min_chars))
+        await update_settings(interaction.guild.id, min_chars=min_chars)
         await interaction.response.send_message(
             embed=discord.Embed(
                 description=f"Minimum characters set to {min_chars}."
@@ -1179,8 +1217,8 @@ class LevelSystem(commands.Cog):
     ):
         await update_settings(
             interaction.guild.id,
-            attachments_bonus=int(attachments_bonus),
-            mentions_bonus=int(mentions_bonus),
+            attachments_bonus=attachments_bonus,
+            mentions_bonus=mentions_bonus,
         )
         await interaction.response.send_message(
             embed=discord.Embed(
@@ -1246,9 +1284,12 @@ class LevelSystem(commands.Cog):
         await update_settings(
             interaction.guild.id,
             curve_type=ct,
-            base_xp=int(base_xp),
-            curve_a=int(curve_a),
-            curve_b=int(curve_b),
+            base_xp=base_xp,
+            curve_a=curve_a,
+            curve_b=curve_b,
+            # Levels earned under this curve can differ from the last recalc's,
+            # even if the curve is later set back, so always allow the next recalc
+            last_recalc_curve_hash=None,
         )
         await interaction.response.send_message(
             embed=discord.Embed(
@@ -1416,9 +1457,10 @@ class LevelSystem(commands.Cog):
                 embed=discord.Embed(description="No blacklisted roles."),
                 ephemeral=True,
             )
+        get_role = interaction.guild.get_role
         mentions = []
         for rid in roles:
-            r = interaction.guild.get_role(rid)
+            r = get_role(rid)
             mentions.append(r.mention if r else f"`{rid}`")
         await interaction.response.send_message(
             embed=discord.Embed(
@@ -1443,7 +1485,7 @@ class LevelSystem(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
         try:
-            await set_role_reward(interaction.guild.id, int(level), role.id)
+            await set_role_reward(interaction.guild.id, level, role.id)
             await interaction.followup.send(
                 embed=discord.Embed(
                     description=f"Set reward for level {level} to {role.mention}."
@@ -1469,7 +1511,7 @@ class LevelSystem(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
         try:
-            await remove_role_reward(interaction.guild.id, int(level))
+            await remove_role_reward(interaction.guild.id, level)
             await interaction.followup.send(
                 embed=discord.Embed(
                     description=f"Removed reward for level {level}."
@@ -1492,11 +1534,12 @@ class LevelSystem(commands.Cog):
                 embed=discord.Embed(description="No role rewards set."),
                 ephemeral=True,
             )
+        get_role = interaction.guild.get_role
         lines: List[str] = []
         for r in rows:
             lvl = int(r["level"])
             role_id = int(r["role_id"])
-            role = interaction.guild.get_role(role_id)
+            role = get_role(role_id)
             if role:
                 lines.append(f"Level {lvl} → {role.mention}")
             else:
@@ -1520,17 +1563,16 @@ class LevelSystem(commands.Cog):
         amount: app_commands.Range[int, -1000000, 1000000],
     ):
         new_total, new_level, leveled_up, awarded = await add_xp_and_check_level_up(
-            interaction.guild, member, int(amount)
+            interaction.guild, member, amount
         )
         msg = f"Gave {amount} XP to {member.mention}. Total XP now {new_total}, level {new_level}."
         if leveled_up:
             msg += f"\n{member.mention} advanced to level {new_level}!"
         if awarded:
-            names = []
-            for lvl, rid in awarded:
-                role = interaction.guild.get_role(rid)
-                if role:
-                    names.append(f"Level {lvl}: {role.mention}")
+            names = [
+                f"Level {lvl}: {role.mention}"
+                for lvl, role in resolve_awarded_roles(interaction.guild, awarded)
+            ]
             if names:
                 msg += "\nRewards granted:\n" + "\n".join(names)
         await interaction.response.send_message(
@@ -1550,32 +1592,31 @@ class LevelSystem(commands.Cog):
         member: discord.Member,
         level_value: app_commands.Range[int, 0, 100000],
     ):
-        s = await get_settings(interaction.guild.id)
+        gid, uid = interaction.guild.id, member.id
+        s = await get_settings(gid)
         # Set XP to exact requirement for that level
         req = xp_required_for_level(
             s["curve_type"],
             int(s["base_xp"]),
             int(s["curve_a"]),
             int(s["curve_b"]),
-            int(level_value),
+            level_value,
         )
         async with _db_lock:
-            cursor.execute(
-                "INSERT INTO user_xp(guild_id, user_id, xp, level, last_message_ts) VALUES (?, ?, ?, ?, COALESCE((SELECT last_message_ts FROM user_xp WHERE guild_id=? AND user_id=?), 0)) "
-                "ON CONFLICT(guild_id, user_id) DO UPDATE SET xp=excluded.xp, level=excluded.level",
-                (
-                    interaction.guild.id,
-                    member.id,
-                    int(req),
-                    int(level_value),
-                    interaction.guild.id,
-                    member.id,
-                ),
-            )
+            # last_message_ts is only written on insert, where no previous value can exist
+            row = cursor.execute(
+                "INSERT INTO user_xp(guild_id, user_id, xp, level, last_message_ts) VALUES (?, ?, ?, ?, 0) "
+                "ON CONFLICT(guild_id, user_id) DO UPDATE SET xp=excluded.xp, level=excluded.level "
+                "RETURNING xp, level",
+                (gid, uid, req, level_value),
+            ).fetchone()
             conn.commit()
+        audit_log(
+            f"{interaction.user} set {member} to level {row['level']} with XP {row['xp']} in {interaction.guild.name} ({gid})."
+        )
         await interaction.response.send_message(
             embed=discord.Embed(
-                description=f"Set {member.mention} to level {level_value} with XP {req}."
+                description=f"Set {member.mention} to level {row['level']} with XP {row['xp']}."
             ),
             ephemeral=True,
         )
@@ -1676,21 +1717,14 @@ class LevelSystem(commands.Cog):
 
         await interaction.response.defer(ephemeral=True)
         for idx, part in enumerate(chunks):
-            if idx == 0 and not interaction.response.is_done():
-                try:
-                    await interaction.response.send_message(
-                        embed=discord.Embed(
-                            description=f"Curve: **{s['curve_type']}**\n```text\n{part}\n```"
-                        ),
-                        ephemeral=True,
-                    )
-                except discord.InteractionResponded:
-                    await interaction.followup.send(
-                        embed=discord.Embed(
-                            description=f"Curve: **{s['curve_type']}**\n```text\n{part}\n```"
-                        ),
-                        ephemeral=True,
-                    )
+            if idx == 0:
+                # The response was deferred above, so every chunk goes out as a followup.
+                await interaction.followup.send(
+                    embed=discord.Embed(
+                        description=f"Curve: **{s['curve_type']}**\n```text\n{part}\n```"
+                    ),
+                    ephemeral=True,
+                )
             else:
                 await interaction.followup.send(
                     embed=discord.Embed(description=f"```text\n{part}\n```"),
@@ -1713,48 +1747,76 @@ class LevelSystem(commands.Cog):
         b = int(s["curve_b"])
 
         gid = interaction.guild.id
+        curve_hash = curve_fingerprint(curve, base_xp, a, b)
+        if s["last_recalc_curve_hash"] == curve_hash:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    description=(
+                        "No recalculation needed. The curve has not changed since the last recalc."
+                    )
+                ),
+                ephemeral=True,
+            )
+
         changed = 0
         awarded_roles_total = 0
 
-        # Pass 1: recalc for members we can address as discord.Member, which will also apply role rewards.
-        async with _db_lock:
-            rows = cursor.execute(
-                "SELECT user_id, xp, level FROM user_xp WHERE guild_id = ?",
-                (gid,),
-            ).fetchall()
-
-        member_ids = {m.id for m in interaction.guild.members}
-        member_rows = [r for r in rows if int(r["user_id"]) in member_ids]
-        other_rows = [r for r in rows if int(r["user_id"]) not in member_ids]
-
-        # Members present in the guild: use the existing pipeline to update level and award roles.
-        for r in member_rows:
-            uid = int(r["user_id"])
-            member = interaction.guild.get_member(uid)
-            if member is None:
-                continue
-            # Add 0 XP to force recompute based on current curve and preserve XP
-            new_total, new_level, _leveled_up, awarded = await add_xp_and_check_level_up(
-                interaction.guild, member, 0
-            )
-            if new_level != int(r["level"]):
-                changed += 1
-            awarded_roles_total += len(awarded)
-
-        # Non-members or uncached users: recompute level numerically and write it back (no role awards).
-        async with _db_lock:
-            for r in other_rows:
+        # Work through the guild's rows one chunk at a time, so memory stays bounded by
+        # RECALC_FETCH_SIZE. Each chunk is read by keyset (user_id > last seen) in its own
+        # short query, so the lock is not held while members' roles are awarded.
+        # Members we can address as discord.Member go through the normal pipeline (role
+        # awards); everyone else is recomputed numerically and written back per chunk.
+        # Role awards hit the Discord API, so run a bounded number of members concurrently.
+        sem = asyncio.Semaphore(RECALC_CONCURRENCY)
+
+        async def _recalc_one(member: discord.Member, old_level: int) -> Tuple[bool, int]:
+            async with sem:
+                # Add 0 XP to force recompute based on current curve and preserve XP
+                _total, new_level, _leveled_up, awarded = (
+                    await add_xp_and_check_level_up(interaction.guild, member, 0)
+                )
+            return new_level != old_level, len(awarded)
+
+        last_uid = -1
+        while True:
+            async with _db_lock:
+                chunk = conn.execute(
+                    "SELECT user_id, xp, level FROM user_xp WHERE guild_id = ? AND user_id > ? "
+                    "ORDER BY user_id LIMIT ?",
+                    (gid, last_uid, RECALC_FETCH_SIZE),
+                ).fetchall()
+            if not chunk:
+                break
+            last_uid = int(chunk[-1]["user_id"])
+
+            member_work = []
+            updates: List[Tuple[int, int, int]] = []
+            for r in chunk:
                 uid = int(r["user_id"])
-                total = int(r["xp"])
                 old_level = int(r["level"])
-                new_level = level_from_total_xp(curve, base_xp, a, b, total)
+                member = interaction.guild.get_member(uid)
+                if member is not None:
+                    member_work.append(_recalc_one(member, old_level))
+                    continue
+                new_level = level_from_total_xp(curve, base_xp, a, b, int(r["xp"]))
                 if new_level != old_level:
-                    cursor.execute(
+                    updates.append((new_level, gid, uid))
+
+            if updates:
+                async with _db_lock:
+                    cursor.executemany(
                         "UPDATE user_xp SET level = ? WHERE guild_id = ? AND user_id = ?",
-                        (new_level, gid, uid),
+                        updates,
                     )
+                    conn.commit()
+                changed += len(updates)
+
+            for level_changed, awarded_count in await asyncio.gather(*member_work):
+                if level_changed:
                     changed += 1
-            conn.commit()
+                awarded_roles_total += awarded_count
+
+        await update_settings(gid, last_recalc_curve_hash=curve_hash)
 
         await interaction.followup.send(
             embed=discord.Embed(
@@ -1814,15 +1876,15 @@ async def view_level_profile(interaction: discord.Interaction, member: discord.M
         await interaction.response.send_message(embed=embed, ephemeral=True)
     except Exception as e:
         logging.error(f"context profile failed: {e}")
-        try:
-            await interaction.response.send_message(
+        if interaction.response.is_done():
+            await interaction.followup.send(
                 embed=create_standard_embed(
                     description="Failed to fetch profile."
                 ),
                 ephemeral=True,
             )
-        except discord.InteractionResponded:
-            await interaction.followup.send(
+        else:
+            await interaction.response.send_message(
                 embed=create_standard_embed(
                     description="Failed to fetch profile."
                 ),
@@ -1,22 +1,28 @@
 import discord
 import logging
-import yaml
 import re
 from discord.ext import commands, tasks
-import datetime
 import asyncio
+import functools
 from typing import Optional, Dict, Any, Set
-from collections import defaultdict
 
+from utils.audit import audit_log
+from utils.config_cache import load_yaml_cached
 
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    try:
-        with open("audit.log", "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
-    except Exception as e:
-        logging.error(f"Failed to write to audit.log: {e}")
+
+# Permission bits @everyone must be allowed and denied on a locked member count channel
+_LOCK_ALLOW = discord.Permissions(view_channel=True).value
+_LOCK_DENY = discord.Permissions(connect=True, speak=True, stream=True).value
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_name(template: str, count: int) -> str:
+    """Render a channel name template, trimmed to Discord's 100-char limit."""
+    name = template.format(count=count)
+    if len(name) > 100:
+        suffix = f" {count}"
+        name = (name[: 100 - len(suffix)]).rstrip() + suffix
+    return name
 
 
 class MemberStats(commands.Cog):
@@ -30,6 +36,12 @@ class MemberStats(commands.Cog):
 
     CONFIG_PATH = "config.yaml"
 
+    # Compiled name-matching regexes by template, shared by every instance
+    _REGEX_CACHE: Dict[str, re.Pattern] = {}
+
+    # Maximum number of guilds verified at once when the bot starts.
+    STARTUP_VERIFY_CONCURRENCY = 16
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.config: Dict[str, Any] = self._load_config()
@@ -47,6 +59,7 @@ class MemberStats(commands.Cog):
         )
         self.include_bots: bool = self.config.get("member_count_include_bots", True)
         self.auto_repair: bool = self.config.get("member_count_auto_repair", True)
+        self._stats_category_name_cf: str = self.stats_category_name.casefold()
 
         # In-memory runtime cache only. Never persisted.
         # Maps guild_id -> channel_id for quick access within the current process.
@@ -55,8 +68,19 @@ class MemberStats(commands.Cog):
         # Tracks guilds configured during this runtime.
         self._configured_guilds: Set[int] = set()
 
-        # Concurrency guards per guild
-        self._guild_locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Concurrency guards per guild, created on first use from a running coroutine
+        self._guild_locks: Dict[int, asyncio.Lock] = {}
+
+        # Per-guild {casefolded name: category} index, rebuilt lazily after any category change
+        self._category_index: Dict[int, Dict[str, discord.CategoryChannel]] = {}
+
+        # Number of bot accounts per guild, counted once and then kept current
+        # from member join/remove events. Used when bots are excluded from the count.
+        self._bot_counts: Dict[int, int] = {}
+
+        # Count the channel name was last confirmed to show, per guild. Cleared
+        # whenever the channel is renamed by anyone, so manual edits are still repaired.
+        self._last_applied_count: Dict[int, int] = {}
 
         # Guilds where the primary template was rejected by Discovery filters
         self._discovery_blocked_guilds: Set[int] = set()
@@ -66,6 +90,10 @@ class MemberStats(commands.Cog):
         self._fallback_name_regex = self._compile_name_regex(
             self.fallback_name_template
         )
+        # Literal prefixes for templates shaped like "Members: {count}", which can be
+        # matched with startswith instead of the regex. None when the regex is needed.
+        self._name_prefix = self._literal_prefix(self.name_template)
+        self._fallback_name_prefix = self._literal_prefix(self.fallback_name_template)
 
     # ---------------------------
     # Lifecycle
@@ -84,22 +112,90 @@ class MemberStats(commands.Cog):
             logging.warning(msg)
             audit_log(msg)
 
-        # Verify or adopt existing channels based on config-driven discovery.
-        for guild in self.bot.guilds:
-            try:
-                await self._verify_or_adopt_for_guild(guild)
-            except Exception as e:
+        # Verify or adopt existing channels based on config-driven discovery
+        await self.verify_or_adopt_all(self.bot.guilds)
+
+        # Start periodic refresh (strictly every 5 minutes)
+        if not self.periodic_refresh.is_running():
+            self.periodic_refresh.start()
+
+    async def verify_or_adopt_all(self, guilds):
+        """
+        Verify or adopt the member count channel in every given guild.
+        Guilds are verified concurrently, bounded to stay inside Discord's rate limits,
+        and errors are logged per guild as each one finishes.
+        """
+        sem = asyncio.Semaphore(self.STARTUP_VERIFY_CONCURRENCY)
+
+        async def _verify(guild: discord.Guild):
+            async with sem:
+                try:
+                    await self._verify_or_adopt_for_guild(guild)
+                except Exception as e:
+                    return guild, e
+                return guild, None
+
+        for next_done in asyncio.as_completed([_verify(g) for g in guilds]):
+            guild, error = await next_done
+            if error is not None:
                 logging.error(
-                    f"[Startup verify] Guild '{guild.name}' ({guild.id}) error: {e}",
-                    exc_info=True,
+                    f"[Startup verify] Guild '{guild.name}' ({guild.id}) error: {error}",
+                    exc_info=error,
                 )
                 audit_log(
-                    f"[Startup verify] Error in guild '{guild.name}' ({guild.id}): {e}"
+                    f"[Startup verify] Error in guild '{guild.name}' ({guild.id}): {error}"
                 )
 
-        # Start periodic refresh (strictly every 5 minutes)
-        if not self.periodic_refresh.is_running():
-            self.periodic_refresh.start()
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        # Drop per-guild state so it does not build up for guilds the bot has left
+        gid = guild.id
+        self._channel_cache.pop(gid, None)
+        self._configured_guilds.discard(gid)
+        self._category_index.pop(gid, None)
+        self._bot_counts.pop(gid, None)
+        self._discovery_blocked_guilds.discard(gid)
+        self._last_applied_count.pop(gid, None)
+        # A lock still held by a running refresh stays until that refresh finishes
+        lock = self._guild_locks.get(gid)
+        if lock is not None and not lock.locked():
+            del self._guild_locks[gid]
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if member.bot and member.guild.id in self._bot_counts:
+            self._bot_counts[member.guild.id] += 1
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        if member.bot and member.guild.id in self._bot_counts:
+            self._bot_counts[member.guild.id] -= 1
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        if isinstance(channel, discord.CategoryChannel):
+            self._category_index.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        if isinstance(channel, discord.CategoryChannel):
+            self._category_index.pop(channel.guild.id, None)
+        elif self._channel_cache.get(channel.guild.id) == channel.id:
+            # The next refresh rediscovers or repairs it
+            self._channel_cache.pop(channel.guild.id, None)
+            self._last_applied_count.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ):
+        if isinstance(after, discord.CategoryChannel):
+            self._category_index.pop(after.guild.id, None)
+        elif (
+            before.name != after.name
+            and self._channel_cache.get(after.guild.id) == after.id
+        ):
+            self._last_applied_count.pop(after.guild.id, None)
 
     # ---------------------------
     # Commands
@@ -312,8 +408,15 @@ class MemberStats(commands.Cog):
     async def periodic_refresh(self):
         """Update member count every 5 minutes."""
         for guild in list(self.bot.guilds):
+            # Channels that already show the right name are skipped without taking the lock
+            if not self._refresh_needed(guild):
+                continue
+            lock = self._guild_lock(guild.id)
+            # A command holding the lock updates the channel itself, so don't queue behind it
+            if lock.locked():
+                continue
             try:
-                async with self._guild_lock(guild.id):
+                async with lock:
                     await self._update_member_count_channel(
                         guild, reason="5-minute scheduled refresh"
                     )
@@ -332,17 +435,37 @@ class MemberStats(commands.Cog):
     # Internal helpers
     # ---------------------------
 
+    def _refresh_needed(self, guild: discord.Guild) -> bool:
+        """
+        Cheap synchronous pre-check run before the scheduled refresh.
+        Only a cached channel that is placed, locked and correctly named is skipped;
+        anything else (including unknown channels) is refreshed.
+        """
+        guild_id = guild.id
+        channel = self._cached_channel(guild)
+        if channel is None:
+            return True
+        category = channel.category
+        if category is None or category.name.casefold() != self._stats_category_name_cf:
+            return True
+        if not self._is_locked(channel):
+            return True
+        count = self._current_member_count(guild, self.include_bots)
+        if self._last_applied_count.get(guild_id) == count:
+            return False
+        if channel.name != self._format_name_for_guild(guild_id, count):
+            return True
+        self._last_applied_count[guild_id] = count
+        return False
+
     def _load_config(self) -> Dict[str, Any]:
         """Load YAML config. Never writes or creates the file."""
         try:
-            with open(self.CONFIG_PATH, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
-                if not isinstance(cfg, dict):
-                    logging.warning(
-                        "Config did not parse to a dict. Using empty defaults."
-                    )
-                    return {}
-                return cfg
+            cfg = load_yaml_cached(self.CONFIG_PATH) or {}
+            if not isinstance(cfg, dict):
+                logging.warning("Config did not parse to a dict. Using empty defaults.")
+                return {}
+            return cfg
         except FileNotFoundError:
             logging.error("config.yaml not found. Proceeding with defaults in memory.")
             audit_log("config.yaml not found. Proceeding with defaults in memory.")
@@ -357,27 +480,49 @@ class MemberStats(commands.Cog):
         Build a regex that matches a channel name derived from the template.
         Example: 'Members: {count}' -> r'^Members:\s*\d+$'
         """
+        cached = self._REGEX_CACHE.get(template)
+        if cached is not None:
+            return cached
         # Escape everything, then replace the escaped {count} with a digit capture
         escaped = re.escape(template)
         escaped = escaped.replace(re.escape("{count}"), r"(\d+)")
         pattern = r"^" + escaped + r"$"
-        return re.compile(pattern)
+        compiled = self._REGEX_CACHE[template] = re.compile(pattern)
+        return compiled
 
-    def _format_name_for_guild(self, guild_id: int, count: int) -> str:
+    @staticmethod
+    def _literal_prefix(template: str) -> Optional[str]:
+        """
+        Return the literal text before {count} when the template ends with it
+        and has no other placeholders, otherwise None.
+        """
+        if not template.endswith("{count}"):
+            return None
+        prefix = template[: -len("{count}")]
+        if "{" in prefix or "}" in prefix:
+            return None
+        return prefix
+
+    @staticmethod
+    def _name_matches(name: str, prefix: Optional[str], regex: re.Pattern) -> bool:
+        """Match a channel name against a template, using the prefix fast path when available."""
+        if prefix is not None:
+            # isdecimal() accepts the same characters as the regex's \d
+            return name.startswith(prefix) and name[len(prefix) :].isdecimal()
+        return regex.match(name) is not None
+
+    def _format_name_for_guild(
+        self, guild_id: int, count: int, template: Optional[str] = None
+    ) -> str:
         """
         Choose template per guild. If Discovery blocked earlier, use fallback.
         Ensure final name fits Discord's 100-char limit.
         """
-        template = (
-            self.fallback_name_template
-            if guild_id in self._discovery_blocked_guilds
-            else self.name_template
-        )
-        name = template.format(count=count)
-        if len(name) > 100:
-            suffix = f" {count}"
-            name = (name[: 100 - len(suffix)]).rstrip() + suffix
-        return name
+        if guild_id in self._discovery_blocked_guilds:
+            template = self.fallback_name_template
+        elif template is None:
+            template = self.name_template
+        return _render_name(template, count)
 
     def _current_member_count(
         self, guild: discord.Guild, include_bots: Optional[bool] = None
@@ -390,8 +535,12 @@ class MemberStats(commands.Cog):
             logging.warning(
                 f"[{guild.name}] Members intent disabled. Counting non-bots may be inaccurate."
             )
-            return sum(1 for m in guild.members if not getattr(m, "bot", False))
-        return sum(1 for m in guild.members if not m.bot)
+            return sum(1 for m in guild.members if not m.bot)
+        bots = self._bot_counts.get(guild.id)
+        if bots is None:
+            # Count once; member join/remove events keep it current afterwards
+            bots = self._bot_counts[guild.id] = sum(1 for m in guild.members if m.bot)
+        return guild.member_count - bots
 
     async def _get_or_discover_channel(
         self, guild: discord.Guild
@@ -400,14 +549,9 @@ class MemberStats(commands.Cog):
         Return the member count channel if known or discoverable by name pattern.
         Uses runtime cache first, then searches by template-derived regexes.
         """
-        # Cached
-        ch_id = self._channel_cache.get(guild.id)
-        if ch_id:
-            ch = guild.get_channel(ch_id)
-            if isinstance(ch, discord.VoiceChannel):
-                return ch
-            # If cached id no longer resolves, drop it
-            self._channel_cache.pop(guild.id, None)
+        ch = self._cached_channel(guild)
+        if ch is not None:
+            return ch
 
         # Discover by name pattern (primary then fallback)
         channel = self._find_member_count_channel(guild)
@@ -417,6 +561,18 @@ class MemberStats(commands.Cog):
             return channel
         return None
 
+    def _cached_channel(self, guild: discord.Guild) -> Optional[discord.VoiceChannel]:
+        """Return the cached channel without any discovery. Drops stale cache entries."""
+        ch_id = self._channel_cache.get(guild.id)
+        if ch_id is None:
+            return None
+        ch = guild.get_channel(ch_id)
+        if isinstance(ch, discord.VoiceChannel):
+            return ch
+        # If cached id no longer resolves, drop it
+        self._channel_cache.pop(guild.id, None)
+        return None
+
     def _find_member_count_channel(
         self, guild: discord.Guild
     ) -> Optional[discord.VoiceChannel]:
@@ -429,8 +585,10 @@ class MemberStats(commands.Cog):
 
         # First gather all voice channels that match either name pattern
         for ch in guild.voice_channels:
-            if self._name_regex.match(ch.name) or self._fallback_name_regex.match(
-                ch.name
+            if self._name_matches(
+                ch.name, self._name_prefix, self._name_regex
+            ) or self._name_matches(
+                ch.name, self._fallback_name_prefix, self._fallback_name_regex
             ):
                 matches.append(ch)
 
@@ -438,11 +596,7 @@ class MemberStats(commands.Cog):
             return None
 
         # Prefer channel within the stats category name, if that category exists
-        target_category = None
-        for cat in guild.categories:
-            if cat.name.casefold() == self.stats_category_name.casefold():
-                target_category = cat
-                break
+        target_category = self._find_category(guild, self._stats_category_name_cf)
 
         if target_category:
             in_cat = [c for c in matches if c.category_id == target_category.id]
@@ -452,18 +606,37 @@ class MemberStats(commands.Cog):
         # Fallback to first match
         return matches[0]
 
+    def _find_category(
+        self, guild: discord.Guild, name_cf: str
+    ) -> Optional[discord.CategoryChannel]:
+        """Look up a category by casefolded name using the per-guild index."""
+        index = self._category_index.get(guild.id)
+        if index is None:
+            index = self._category_index[guild.id] = {}
+            for cat in guild.categories:
+                # Keep the first category per name, as the old linear scan did
+                index.setdefault(cat.name.casefold(), cat)
+        return index.get(name_cf)
+
     async def _find_or_create_stats_category(
         self, guild: discord.Guild, name: str
     ) -> discord.CategoryChannel:
         """Find a category by name (case-insensitive) or create it."""
-        for cat in guild.categories:
-            if cat.name.casefold() == name.casefold():
-                return cat
+        name_cf = (
+            self._stats_category_name_cf
+            if name == self.stats_category_name
+            else name.casefold()
+        )
+        existing = self._find_category(guild, name_cf)
+        if existing is not None:
+            return existing
 
         try:
             category = await guild.create_category(
                 name=name, reason="Create stats category"
             )
+            # Don't wait for the gateway event before the new category is visible
+            self._category_index.pop(guild.id, None)
             audit_log(
                 f"Created stats category '{name}' in guild '{guild.name}' ({guild.id})."
             )
@@ -489,95 +662,98 @@ class MemberStats(commands.Cog):
         reason: str,
     ) -> discord.VoiceChannel:
         """Create the voice channel for the first time. Does not write to config."""
-        # Temporarily apply template and include_bots for this call
-        original_template = self.name_template
-        original_include = self.include_bots
-        self.name_template = name_template
-        self.include_bots = include_bots
-        self._name_regex = self._compile_name_regex(self.name_template)
-
-        try:
-            category = await self._find_or_create_stats_category(guild, category_name)
-            everyone = guild.default_role
-            overwrites = {
-                everyone: discord.PermissionOverwrite(
-                    view_channel=True, connect=False, speak=False, stream=False
-                )
-            }
-            count = self._current_member_count(guild, include_bots)
-            desired_name = self._format_name_for_guild(guild.id, count)
-            channel = await guild.create_voice_channel(
-                name=desired_name,
-                category=category,
-                overwrites=overwrites,
-                reason=reason,
+        category = await self._find_or_create_stats_category(guild, category_name)
+        everyone = guild.default_role
+        overwrites = {
+            everyone: discord.PermissionOverwrite(
+                view_channel=True, connect=False, speak=False, stream=False
             )
+        }
+        count = self._current_member_count(guild, include_bots)
+        desired_name = self._format_name_for_guild(guild.id, count, name_template)
+        channel = await guild.create_voice_channel(
+            name=desired_name,
+            category=category,
+            overwrites=overwrites,
+            reason=reason,
+        )
 
-            # Cache in memory for this runtime
-            self._channel_cache[guild.id] = channel.id
-            self._configured_guilds.add(guild.id)
+        # Cache in memory for this runtime
+        self._channel_cache[guild.id] = channel.id
+        self._configured_guilds.add(guild.id)
 
-            logging.info(
-                f"[{guild.name}] Created member count channel #{channel.name} ({channel.id})."
-            )
-            audit_log(
-                f"Created member count channel #{channel.name} ({channel.id}) in guild '{guild.name}' ({guild.id})."
-            )
-            return channel
-        finally:
-            self.name_template = original_template
-            self.include_bots = original_include
-            self._name_regex = self._compile_name_regex(self.name_template)
+        logging.info(
+            f"[{guild.name}] Created member count channel #{channel.name} ({channel.id})."
+        )
+        audit_log(
+            f"Created member count channel #{channel.name} ({channel.id}) in guild '{guild.name}' ({guild.id})."
+        )
+        return channel
+
+    @staticmethod
+    def _is_locked(channel: discord.VoiceChannel) -> bool:
+        """True when @everyone can see but not join, speak or stream in the channel."""
+        # Compare the allow/deny bits as a whole rather than flag by flag
+        allow, deny = channel.overwrites_for(channel.guild.default_role).pair()
+        return (
+            allow.value & _LOCK_ALLOW == _LOCK_ALLOW
+            and deny.value & _LOCK_DENY == _LOCK_DENY
+        )
 
     async def _place_and_lock(self, channel: discord.VoiceChannel, category_name: str):
-        """Move to category if needed, then lock overwrites."""
+        """Move to category if needed and lock overwrites, in a single channel edit."""
         category = await self._find_or_create_stats_category(
             channel.guild, category_name
         )
-        if channel.category_id != category.id:
-            try:
-                await channel.edit(category=category, reason="Move to stats category")
-                audit_log(
-                    f"Moved member count channel to stats category in guild '{channel.guild.name}' ({channel.guild.id})."
-                )
-                logging.info(f"Moved member count channel to '{category.name}'.")
-            except discord.HTTPException as e:
-                logging.warning(
-                    f"Failed moving channel category in '{channel.guild.name}': {e}"
-                )
+        needs_move = channel.category_id != category.id
+        needs_lock = not self._is_locked(channel)
+        if not needs_move and not needs_lock:
+            return
 
-        everyone = channel.guild.default_role
-        current_overwrites = channel.overwrites_for(everyone)
-        should_update = (
-            current_overwrites.view_channel is not True
-            or current_overwrites.connect is not False
-            or current_overwrites.speak is not False
-            or current_overwrites.stream is not False
-        )
-        if should_update:
-            try:
-                await channel.set_permissions(
-                    target=everyone,
-                    view_channel=True,
-                    connect=False,
-                    speak=False,
-                    stream=False,
-                    reason="Lock member count voice channel",
-                )
-            except discord.HTTPException as e:
-                logging.warning(
-                    f"Failed updating overwrites in '{channel.guild.name}': {e}"
-                )
+        changes: Dict[str, Any] = {}
+        reasons = []
+        if needs_move:
+            changes["category"] = category
+            reasons.append("Move to stats category")
+        if needs_lock:
+            # edit() replaces every overwrite, so keep the others and only lock @everyone
+            everyone = channel.guild.default_role
+            overwrites = dict(channel.overwrites)
+            overwrite = overwrites.get(everyone, discord.PermissionOverwrite())
+            overwrite.update(view_channel=True, connect=False, speak=False, stream=False)
+            overwrites[everyone] = overwrite
+            changes["overwrites"] = overwrites
+            reasons.append("Lock member count voice channel")
+
+        try:
+            await channel.edit(**changes, reason="; ".join(reasons))
+        except discord.HTTPException as e:
+            logging.warning(
+                f"Failed moving or locking member count channel in '{channel.guild.name}': {e}"
+            )
+            return
+
+        if needs_move:
+            audit_log(
+                f"Moved member count channel to stats category in guild '{channel.guild.name}' ({channel.guild.id})."
+            )
+            logging.info(f"Moved member count channel to '{category.name}'.")
 
     async def _apply_rename(
-        self, channel: discord.VoiceChannel, count: int, reason: str
+        self,
+        channel: discord.VoiceChannel,
+        count: int,
+        reason: str,
+        template: Optional[str] = None,
     ):
         """Attempt to rename. If Discovery blocks, switch to fallback template for this guild and retry once."""
-        desired = self._format_name_for_guild(channel.guild.id, count)
+        desired = self._format_name_for_guild(channel.guild.id, count, template)
         if channel.name == desired:
+            self._last_applied_count[channel.guild.id] = count
             return
         try:
             await channel.edit(name=desired, reason=reason)
+            self._last_applied_count[channel.guild.id] = count
             logging.info(f"Renamed member count channel to '{desired}'.")
             audit_log(
                 f"Renamed member count channel to '{desired}' in guild '{channel.guild.name}' ({channel.guild.id})."
@@ -599,6 +775,7 @@ class MemberStats(commands.Cog):
                         await channel.edit(
                             name=safe_name, reason=reason + " (discovery-safe fallback)"
                         )
+                        self._last_applied_count[gid] = count
                         logging.info(f"Discovery-safe rename applied: '{safe_name}'.")
                         audit_log(
                             f"Discovery-safe rename applied to '{safe_name}' in guild '{channel.guild.name}' ({channel.guild.id})."
@@ -660,58 +837,47 @@ class MemberStats(commands.Cog):
         if guild.id not in self._configured_guilds:
             raise RuntimeError("Attempted to ensure channel for an unconfigured guild.")
 
-        # Temporarily apply template and include_bots for this call
-        original_template = self.name_template
-        original_include = self.include_bots
-        self.name_template = name_template
-        self.include_bots = include_bots
-        self._name_regex = self._compile_name_regex(self.name_template)
-
-        try:
-            channel = await self._get_or_discover_channel(guild)
-            if channel is None:
-                # Create a replacement
-                category = await self._find_or_create_stats_category(
-                    guild, category_name
-                )
-                everyone = guild.default_role
-                overwrites = {
-                    everyone: discord.PermissionOverwrite(
-                        view_channel=True, connect=False, speak=False, stream=False
-                    )
-                }
-                count = self._current_member_count(guild, include_bots)
-                desired_name = self._format_name_for_guild(guild.id, count)
-                channel = await guild.create_voice_channel(
-                    name=desired_name,
-                    category=category,
-                    overwrites=overwrites,
-                    reason=reason,
+        channel = await self._get_or_discover_channel(guild)
+        if channel is None:
+            # Create a replacement
+            category = await self._find_or_create_stats_category(
+                guild, category_name
+            )
+            everyone = guild.default_role
+            overwrites = {
+                everyone: discord.PermissionOverwrite(
+                    view_channel=True, connect=False, speak=False, stream=False
                 )
+            }
+            count = self._current_member_count(guild, include_bots)
+            desired_name = self._format_name_for_guild(guild.id, count, name_template)
+            channel = await guild.create_voice_channel(
+                name=desired_name,
+                category=category,
+                overwrites=overwrites,
+                reason=reason,
+            )
 
-                # Cache new id and keep configured flag
-                self._channel_cache[guild.id] = channel.id
+            # Cache new id and keep configured flag
+            self._channel_cache[guild.id] = channel.id
 
-                logging.info(
-                    f"[{guild.name}] Recreated member count channel #{channel.name} ({channel.id})."
-                )
-                audit_log(
-                    f"Recreated member count channel #{channel.name} ({channel.id}) in guild '{guild.name}' ({guild.id})."
-                )
-            else:
-                # Already exists, just ensure placement/lock and rename
-                await self._place_and_lock(channel, category_name)
-                await self._apply_rename(
-                    channel,
-                    self._current_member_count(guild, include_bots),
-                    reason,
-                )
+            logging.info(
+                f"[{guild.name}] Recreated member count channel #{channel.name} ({channel.id})."
+            )
+            audit_log(
+                f"Recreated member count channel #{channel.name} ({channel.id}) in guild '{guild.name}' ({guild.id})."
+            )
+        else:
+            # Already exists, just ensure placement/lock and rename
+            await self._place_and_lock(channel, category_name)
+            await self._apply_rename(
+                channel,
+                self._current_member_count(guild, include_bots),
+                reason,
+                name_template,
+            )
 
-            return channel
-        finally:
-            self.name_template = original_template
-            self.include_bots = original_include
-            self._name_regex = self._compile_name_regex(self.name_template)
+        return channel
 
     async def _verify_or_adopt_for_guild(self, guild: discord.Guild):
         """
@@ -728,7 +894,9 @@ class MemberStats(commands.Cog):
             self._configured_guilds.add(guild.id)
 
             # If the adopted name matches the fallback regex, mark guild as discovery-blocked
-            if self._fallback_name_regex.match(channel.name):
+            if self._name_matches(
+                channel.name, self._fallback_name_prefix, self._fallback_name_regex
+            ):
                 self._discovery_blocked_guilds.add(guild.id)
 
             # Ensure overwrites and correct name
@@ -744,7 +912,10 @@ class MemberStats(commands.Cog):
     # ---------------------------
 
     def _guild_lock(self, guild_id: int) -> asyncio.Lock:
-        return self._guild_locks[guild_id]
+        lock = self._guild_locks.get(guild_id)
+        if lock is None:
+            lock = self._guild_locks[guild_id] = asyncio.Lock()
+        return lock
 
     # ---------------------------
     # Cog teardown
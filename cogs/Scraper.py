@@ -1,35 +1,152 @@
 import discord
 import logging
-import yaml
 from discord import app_commands
 from discord.ext import commands
 import asyncio
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
-import requests  # For HTTP requests to the Live page
+import aiohttp  # For HTTP requests to the Live page
 import unicodedata
 import string
-from bs4 import BeautifulSoup  # For HTML parsing
-from typing import List, Tuple, Optional
+import re
+import functools
+from selectolax.lexbor import LexborHTMLParser  # For HTML parsing
+from typing import Dict, List, Tuple, Optional
+from utils.audit import audit_log
+from utils.config_cache import load_yaml_cached
+
+
+# Opening tag of <section id="live">; parsing starts here so the rest of the
+# homepage before it is never tokenised.
+_LIVE_SECTION_RE = re.compile(rb"""<section\b[^>]*\bid\s*=\s*["']?live["'\s>]""", re.I)
+
+
+# English month names, keyed by the lowercase full name and abbreviation
+# (plus 'sept'). Dates are parsed with these and a regex rather than strptime,
+# which is slow and locale-dependent.
+_MONTHS = {
+    key: (name, number)
+    for number, name in enumerate(
+        (
+            "January",
+            "February",
+            "March",
+            "April",
+            "May",
+            "June",
+            "July",
+            "August",
+            "September",
+            "October",
+            "November",
+            "December",
+        ),
+        start=1,
+    )
+    for key in (name.lower(), name[:3].lower())
+}
+_MONTHS["sept"] = _MONTHS["sep"]
+# Dates as shown on the live page, e.g. '16th Aug 2025'
+_LIVE_DATE_RE = re.compile(r"(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]+)\.?\s+(\d{4})")
+# Dates in the legacy page format, e.g. 'Aug 16, 2025'
+_PAGE_DATE_RE = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})")
+# Dates as produced by _format_day_month_year, e.g. '16 August 2025'
+_FORMATTED_DATE_RE = re.compile(r"(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})")
+
+
+def _lookup_month(text: str) -> Tuple[str, int]:
+    month = _MONTHS.get(text.lower())
+    if month is None:
+        raise ValueError(f"unknown month '{text}'")
+    return month
+
+
+def _format_day_month_year(day: int, month_text: str, year: int) -> str:
+    """Return e.g. '16 August 2025'. Raises ValueError for an invalid date."""
+    name, number = _lookup_month(month_text)
+    datetime(year, number, day)  # validates the day for this month
+    return f"{day:02d} {name} {year}"
+
+
+def _format_page_date(text: str) -> str:
+    """Convert e.g. 'Aug 16, 2025' to '16 August 2025'. Raises ValueError if it does not match."""
+    match = _PAGE_DATE_RE.fullmatch(text.strip())
+    if not match:
+        raise ValueError(f"date '{text}' does not match 'Mon DD, YYYY'")
+    month_text, day, year = match.groups()
+    return _format_day_month_year(int(day), month_text, int(year))
+
+
+def _parse_formatted_date(text: str) -> datetime:
+    """Parse a date like '16 August 2025'. Raises ValueError if it does not match."""
+    match = _FORMATTED_DATE_RE.fullmatch(text.strip())
+    if not match:
+        raise ValueError(f"date '{text}' does not match 'DD Month YYYY'")
+    day, month_text, year = match.groups()
+    return datetime(int(year), _lookup_month(month_text)[1], int(day))
+
+
+def _extract_live_rows(html: bytes) -> List[Tuple[str, str, str, Optional[str]]]:
+    """
+    Return the raw (date, venue, location, tickets_url) text of every
+    <div class="live-date"> in the homepage's <section id="live">.
+    Runs in a worker thread, so it does no logging of its own.
+    Takes the raw response body; Lexbor decodes it while parsing.
+    Raises LookupError if the section or its <div id="live-dates"> is missing.
+    """
+    # Parse the HTML with selectolax (Lexbor, a C parser), starting at #live if found
+    match = _LIVE_SECTION_RE.search(html)
+    tree = LexborHTMLParser(html[match.start() :] if match else html)
+
+    # Find the <section id="live"> and inside it the <div id="live-dates">
+    live_section = tree.css_first("section#live")
+    if live_section is None:
+        raise LookupError("<section id='live'> not found on homepage.")
+    live_dates = live_section.css_first("div#live-dates")
+    if live_dates is None:
+        raise LookupError("<div id='live-dates'> not found in #live section.")
+
+    # Each <div class="live-date"> is one show
+    rows: List[Tuple[str, str, str, Optional[str]]] = []
+    for div in live_dates.css("div.live-date"):
+        date_tag = div.css_first("p.date")
+        venue_tag = div.css_first("p.venue")
+        location_tag = div.css_first("p.location")
+        ticket_tag = div.css_first("a.tickets")
+        rows.append(
+            (
+                date_tag.text(strip=True) if date_tag is not None else "",
+                venue_tag.text(strip=True) if venue_tag is not None else "",
+                location_tag.text(strip=True) if location_tag is not None else "",
+                ticket_tag.attributes.get("href") if ticket_tag is not None else None,
+            )
+        )
+    return rows
+
+
+_ERROR_COLOUR = discord.Color.red()
+
 
+def _error_embed(description: str) -> discord.Embed:
+    """Build the red "Error" embed sent for every failure in this cog."""
+    return discord.Embed(title="Error", description=description, color=_ERROR_COLOUR)
 
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    try:
-        with open("audit.log", "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
-    except Exception as e:
-        logging.error(f"Failed to write to audit.log: {e}")
 
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+_PUNCT_SET = frozenset(string.punctuation)
 
+
+@functools.lru_cache(maxsize=4096)
 def normalize_string(s: str) -> str:
     """
     Normalize a string by removing diacritics, punctuation, extra whitespace,
     and converting to lowercase.
     """
-    s = unicodedata.normalize("NFKD", s).encode("ASCII", "ignore").decode("utf-8")
-    s = s.translate(str.maketrans("", "", string.punctuation))
+    # NFKD leaves plain ASCII unchanged, and most venue names need no translate either
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s).encode("ASCII", "ignore").decode("utf-8")
+    if not _PUNCT_SET.isdisjoint(s):
+        s = s.translate(_PUNCT_TABLE)
     return " ".join(s.split()).lower()
 
 
@@ -37,12 +154,47 @@ class Scrape(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         # Load the config file with UTF-8 encoding.
-        with open("config.yaml", "r", encoding="utf-8") as config_file:
-            self.config = yaml.safe_load(config_file) or {}
+        self.config = load_yaml_cached("config.yaml") or {}
         # The URL containing the <section id="live"> structure.
         self.LIVE_PAGE_URL = "https://www.thisissigrid.com/"
+        # Keep-alive session reused across /scrape runs, so repeat requests skip
+        # the TCP and TLS handshakes. Created on first use inside the event loop.
+        # aiohttp asks for gzip/deflate itself, and adds br when Brotli is installed.
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Normalized starter message content by thread ID, so each thread's
+        # starter message is fetched at most once per process.
+        self._starter_content: Dict[int, str] = {}
+        # Resolved once, so a missing tz database warns once rather than per event
+        self._tz = self._get_london_tz()
+        # Cover image for scheduled events, read once rather than on every /scrape
+        try:
+            with open("event-image.jpg", "rb") as img_file:
+                self._event_image: Optional[bytes] = img_file.read()
+        except Exception as e:
+            logging.error(f"Failed to load event image: {e}")
+            audit_log(f"Failed to load event image: {e}")
+            self._event_image = None
         audit_log("Scrape cog initialised and configuration loaded successfully.")
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={
+                    "User-Agent": (
+                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                        "AppleWebKit/537.36 (KHTML, like Gecko) "
+                        "Chrome/126.0.0.0 Safari/537.36"
+                    ),
+                    "Accept-Language": "en-GB,en;q=0.9",
+                },
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self._session
+
+    async def cog_unload(self):
+        if self._session is not None:
+            await self._session.close()
+
     @commands.Cog.listener()
     async def on_ready(self):
         logging.info(f"\033[96mScrape\033[0m cog synced successfully.")
@@ -59,7 +211,7 @@ class Scrape(commands.Cog):
                 embed=discord.Embed(
                     title="Unavailable in DMs",
                     description="Please run `/scrape` inside a server.",
-                    color=discord.Color.red(),
+                    color=_ERROR_COLOUR,
                 ),
                 ephemeral=True,
             )
@@ -79,19 +231,31 @@ class Scrape(commands.Cog):
         )
         try:
             audit_log("Starting scraping process via /scrape command.")
-            # Run the scraper asynchronously in a separate thread.
-            new_entries = await asyncio.to_thread(self.run_scraper)
+            new_entries = await self.run_scraper()
             audit_log(
                 f"{user_name} (ID: {user_id}) retrieved {len(new_entries)} new entries from the website."
             )
+            # Fetch the guild's scheduled events once; both checks below use them.
+            try:
+                scheduled_events = await interaction.guild.fetch_scheduled_events()
+                logging.debug(
+                    f"Guild '{guild_name}' has {len(scheduled_events)} scheduled events."
+                )
+            except Exception as e:
+                logging.error(f"Error fetching scheduled events: {e}")
+                audit_log(f"Error fetching scheduled events during /scrape: {e}")
+                scheduled_events = None
             # Create forum threads and get count.
             threads_created = await self.check_forum_threads(
-                interaction.guild, interaction, new_entries
-            )
-            # Create scheduled events and get count.
-            events_created = await self.check_server_events(
-                interaction.guild, interaction, new_entries
+                interaction.guild, interaction, new_entries, scheduled_events or []
             )
+            # Create scheduled events and get count. Without the existing
+            # events every show would look new, so skip rather than duplicate.
+            events_created = 0
+            if scheduled_events is not None:
+                events_created = await self.check_server_events(
+                    interaction.guild, interaction, new_entries, scheduled_events
+                )
             # Send a combined summary.
             await self.send_combined_summary(
                 interaction, threads_created, events_created
@@ -105,10 +269,8 @@ class Scrape(commands.Cog):
             audit_log(
                 f"{user_name} (ID: {user_id}) encountered an error in /scrape command: {e}"
             )
-            error_embed = discord.Embed(
-                title="Error",
-                description="Something went wrong while checking the website. Please try again later.",
-                color=discord.Color.red(),
+            error_embed = _error_embed(
+                "Something went wrong while checking the website. Please try again later."
             )
             try:
                 await interaction.followup.send(embed=error_embed)
@@ -120,7 +282,7 @@ class Scrape(commands.Cog):
     # HTML scraping for #live
     # ---------------------------
 
-    def run_scraper(self) -> List[Tuple[str, str, str, Optional[str]]]:
+    async def run_scraper(self) -> List[Tuple[str, str, str, Optional[str]]]:
         """
         Scrape Sigrid's homepage for the <section id="live"> structure and extract
         each <div class="live-date"> block. Return a list of tuples:
@@ -135,104 +297,64 @@ class Scrape(commands.Cog):
         audit_log(
             "Starting scraper: Requesting event data from homepage #live section."
         )
-        new_entries: List[Tuple[str, str, str, Optional[str]]] = []
+        try:
+            async with self._get_session().get(self.LIVE_PAGE_URL) as response:
+                response.raise_for_status()
+                # Raw bytes: no decode here, selectolax reads them directly
+                html = await response.read()
+        except Exception as e:
+            logging.error(f"Error fetching homepage live section: {e}")
+            audit_log(f"Error fetching HTML from {self.LIVE_PAGE_URL}: {e}")
+            return []
 
+        # Parse in a worker thread so the event loop keeps serving events meanwhile
         try:
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/126.0.0.0 Safari/537.36"
-                ),
-                "Accept-Language": "en-GB,en;q=0.9",
-            }
-            response = requests.get(self.LIVE_PAGE_URL, timeout=15, headers=headers)
-            response.raise_for_status()
-            html = response.text
-
-            # Parse the HTML with BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Find the <section id="live"> and inside it the <div id="live-dates">
-            live_section = soup.find("section", id="live")
-            if not live_section:
-                logging.error("Could not find <section id='live'> on the page.")
-                audit_log("Error: <section id='live'> not found on homepage.")
-                return []
-
-            live_dates = live_section.find("div", id="live-dates")
-            if not live_dates:
-                logging.error("Could not find <div id='live-dates'> within #live.")
-                audit_log("Error: <div id='live-dates'> not found in #live section.")
-                return []
-
-            # Each <div class="live-date"> is one show
-            items = live_dates.find_all("div", class_="live-date")
-            logging.info(f"Found {len(items)} <div class='live-date'> elements.")
-            audit_log(f"Found {len(items)} shows in #live section.")
-
-            for div in items:
-                try:
-                    # Extract fields
-                    date_tag = div.find("p", class_="date")
-                    venue_tag = div.find("p", class_="venue")
-                    location_tag = div.find("p", class_="location")
-                    ticket_tag = div.find("a", class_="tickets")
-
-                    raw_date = date_tag.get_text(strip=True) if date_tag else ""
-                    venue = venue_tag.get_text(strip=True) if venue_tag else ""
-                    raw_location = (
-                        location_tag.get_text(strip=True) if location_tag else ""
-                    )
-                    tickets_url = ticket_tag.get("href") if ticket_tag else None
+            rows = await asyncio.to_thread(_extract_live_rows, html)
+        except LookupError as e:
+            logging.error(f"Could not find the live dates on the page: {e}")
+            audit_log(f"Error: {e}")
+            return []
+        except Exception as e:
+            logging.error(f"Error parsing homepage live section: {e}")
+            audit_log(f"Error parsing HTML from {self.LIVE_PAGE_URL}: {e}")
+            return []
 
-                    formatted_date = self._parse_live_date(raw_date)
-                    location = self._clean_location(raw_location)
+        logging.info(f"Found {len(rows)} <div class='live-date'> elements.")
+        audit_log(f"Found {len(rows)} shows in #live section.")
 
-                    new_entries.append((formatted_date, venue, location, tickets_url))
-                    logging.debug(
-                        f"Parsed entry: ({formatted_date}, {venue}, {location}, {tickets_url})"
-                    )
-                    audit_log(
-                        f"Processed show: {formatted_date} @ {venue}, {location} | Tickets: {tickets_url or 'None'}"
-                    )
+        new_entries: List[Tuple[str, str, str, Optional[str]]] = []
+        for raw_date, venue, raw_location, tickets_url in rows:
+            try:
+                formatted_date = self._parse_live_date(raw_date)
+                location = self._clean_location(raw_location)
 
-                except Exception as inner_e:
-                    logging.error(f"Error parsing one <div.live-date>: {inner_e}")
-                    audit_log(f"Error parsing <div class='live-date'>: {inner_e}")
-                    continue
+                new_entries.append((formatted_date, venue, location, tickets_url))
+                logging.debug(
+                    f"Parsed entry: ({formatted_date}, {venue}, {location}, {tickets_url})"
+                )
+                audit_log(
+                    f"Processed show: {formatted_date} @ {venue}, {location} | Tickets: {tickets_url or 'None'}"
+                )
 
-        except Exception as e:
-            logging.error(f"Error fetching homepage live section: {e}")
-            audit_log(f"Error fetching HTML from {self.LIVE_PAGE_URL}: {e}")
+            except Exception as inner_e:
+                logging.error(f"Error parsing one <div.live-date>: {inner_e}")
+                audit_log(f"Error parsing <div class='live-date'>: {inner_e}")
+                continue
 
         return new_entries
 
-    @staticmethod
-    def _strip_ordinal(day_text: str) -> str:
-        """Remove English ordinal suffixes from a day string like '16th' -> '16'."""
-        return (
-            day_text.replace("st", "")
-            .replace("nd", "")
-            .replace("rd", "")
-            .replace("th", "")
-        )
-
     def _parse_live_date(self, raw: str) -> str:
         """
         Convert raw date like '16th Aug 2025' into '16 August 2025'.
         Falls back to the raw string if parsing fails.
         """
-        try:
-            parts = raw.split()
-            if len(parts) == 3:
-                day = self._strip_ordinal(parts[0])
-                month_abbr = parts[1]
-                year = parts[2]
-                dt = datetime.strptime(f"{day} {month_abbr} {year}", "%d %b %Y")
-                return dt.strftime("%d %B %Y")
+        match = _LIVE_DATE_RE.fullmatch(raw.strip())
+        if not match:
             return raw
-        except Exception as e:
+        day, month_text, year = match.groups()
+        try:
+            return _format_day_month_year(int(day), month_text, int(year))
+        except ValueError as e:
             logging.error(f"Error parsing live date '{raw}': {e}")
             audit_log(f"Error parsing live date '{raw}': {e}")
             return raw
@@ -245,8 +367,7 @@ class Scrape(commands.Cog):
         """
         if not raw:
             return ""
-        cleaned = raw.strip().rstrip(",").strip()
-        return cleaned
+        return raw.strip().rstrip(",").strip()
 
     # ---------------------------
     # Timezone handling
@@ -276,13 +397,11 @@ class Scrape(commands.Cog):
         # Original method for page-based dates remains unchanged.
         if "-" in date_str:
             start_date_str, end_date_str = map(str.strip, date_str.split("-"))
-            start_date = datetime.strptime(start_date_str, "%b %d, %Y").strftime(
-                "%d %B %Y"
-            )
-            end_date = datetime.strptime(end_date_str, "%b %d, %Y").strftime("%d %B %Y")
+            start_date = _format_page_date(start_date_str)
+            end_date = _format_page_date(end_date_str)
             return f"{start_date} - {end_date}"
         else:
-            return datetime.strptime(date_str, "%b %d, %Y").strftime("%d %B %Y")
+            return _format_page_date(date_str)
 
     def parse_event_dates(self, formatted_date: str):
         """
@@ -295,11 +414,11 @@ class Scrape(commands.Cog):
         Uses Europe/London if available, otherwise UTC.
         """
         try:
-            tz = self._get_london_tz()
+            tz = self._tz
             if "-" in formatted_date:
                 start_date_str, end_date_str = map(str.strip, formatted_date.split("-"))
-                dt_start = datetime.strptime(start_date_str, "%d %B %Y")
-                dt_end = datetime.strptime(end_date_str, "%d %B %Y")
+                dt_start = _parse_formatted_date(start_date_str)
+                dt_end = _parse_formatted_date(end_date_str)
                 start_dt = datetime(
                     dt_start.year, dt_start.month, dt_start.day, 8, 0, 0, tzinfo=tz
                 )
@@ -307,7 +426,7 @@ class Scrape(commands.Cog):
                     dt_end.year, dt_end.month, dt_end.day, 23, 0, 0, tzinfo=tz
                 )
             else:
-                dt = datetime.strptime(formatted_date, "%d %B %Y")
+                dt = _parse_formatted_date(formatted_date)
                 start_dt = datetime(dt.year, dt.month, dt.day, 19, 0, 0, tzinfo=tz)
                 end_dt = datetime(dt.year, dt.month, dt.day, 23, 0, 0, tzinfo=tz)
             logging.debug(
@@ -325,27 +444,23 @@ class Scrape(commands.Cog):
     # Discord thread and event creation
     # ---------------------------
 
-    async def check_forum_threads(self, guild, interaction, new_entries):
+    async def check_forum_threads(
+        self, guild, interaction, new_entries, scheduled_events
+    ):
         audit_log("Starting check for forum threads for new entries.")
         liveshows_channel_id = self.config.get("liveshows_channel_id")
         if not liveshows_channel_id:
             logging.error("Missing 'liveshows_channel_id' in config.")
             await interaction.followup.send(
-                embed=discord.Embed(
-                    title="Error",
-                    description="Missing 'liveshows_channel_id' in config.yaml.",
-                    color=discord.Color.red(),
-                )
+                embed=_error_embed("Missing 'liveshows_channel_id' in config.yaml.")
             )
             return 0
 
         liveshows_channel = guild.get_channel(liveshows_channel_id)
         if liveshows_channel is None:
             logging.error(f"Channel with ID {liveshows_channel_id} not found.")
-            error_embed = discord.Embed(
-                title="Error",
-                description="Threads channel was not found. Please double-check the config.",
-                color=discord.Color.red(),
+            error_embed = _error_embed(
+                "Threads channel was not found. Please double-check the config."
             )
             await interaction.followup.send(embed=error_embed)
             audit_log(
@@ -354,18 +469,51 @@ class Scrape(commands.Cog):
             )
             return 0
 
+        # Index the channel's threads by normalized name once per scrape
+        existing_threads: Dict[str, List[discord.Thread]] = {}
+        try:
+            threads = liveshows_channel.threads
+        except Exception as e:
+            logging.error(f"Error accessing channel threads: {e}")
+            threads = []
+        for thread in threads:
+            existing_threads.setdefault(normalize_string(thread.name), []).append(
+                thread
+            )
+        logging.debug(
+            f"Channel '{getattr(liveshows_channel, 'name', 'unknown')}' has {len(threads)} active threads."
+        )
+        # Scheduled event names, normalized once for the fallback check
+        event_names = [(normalize_string(e.name), e.name) for e in scheduled_events]
+        # Fetch the starter messages of every thread a new entry could collide
+        # with together, rather than one at a time inside thread_exists
+        await self._prefetch_starter_content(
+            thread
+            for entry in new_entries
+            for thread in existing_threads.get(normalize_string(entry[0].title()), ())
+        )
+
         new_threads_created = 0
+        # Entries are created one at a time, in page order, so a show listed
+        # twice is only created once; discord.py's rate limiter handles any
+        # backoff Discord asks for.
         for entry in new_entries:
             # entry = (event_date, venue, location, tickets_url)
             event_date, venue, location, tickets_url = entry
             thread_title = event_date.title()
+            venue_title = venue.title() if venue else ""
+            location_title = location.title() if location else ""
             norm_title = normalize_string(thread_title)
             norm_location = normalize_string(location)
             logging.debug(
                 f"Checking thread: original title='{thread_title}', normalized='{norm_title}', location normalized='{norm_location}'"
             )
             exists = await self.thread_exists(
-                liveshows_channel, norm_title, norm_location
+                liveshows_channel,
+                norm_title,
+                norm_location,
+                existing_threads,
+                event_names,
             )
             logging.info(
                 f"Does thread '{thread_title}' with location '{location}' exist in channel '{getattr(liveshows_channel, 'name', 'unknown')}'? {exists}"
@@ -377,7 +525,7 @@ class Scrape(commands.Cog):
             if not exists:
                 try:
                     content_base = (
-                        f"Sigrid at {venue.title()}, {location.title()}"
+                        f"Sigrid at {venue_title}, {location_title}"
                         if venue or location
                         else "Sigrid live"
                     )
@@ -387,11 +535,16 @@ class Scrape(commands.Cog):
                         else content_base
                     )
                     logging.info(f"Creating thread for: {thread_title}")
-                    await liveshows_channel.create_thread(
+                    created = await liveshows_channel.create_thread(
                         name=thread_title,
                         content=content,
                         auto_archive_duration=60,
                     )
+                    self._starter_content[created.thread.id] = normalize_string(
+                        content
+                    )
+                    # Register it so a later duplicate entry finds this thread
+                    existing_threads.setdefault(norm_title, []).append(created.thread)
                     new_threads_created += 1
                     logging.info(f"Successfully created thread: {thread_title}")
                     audit_log(
@@ -399,15 +552,12 @@ class Scrape(commands.Cog):
                         f"created thread '{thread_title}' in channel #{getattr(liveshows_channel, 'name', 'unknown')} (ID: {getattr(liveshows_channel, 'id', 'unknown')}) "
                         f"in guild '{guild.name}' (ID: {guild.id})."
                     )
-                    await asyncio.sleep(2)
                 except discord.Forbidden:
                     logging.error(
                         f"Permission denied when trying to create thread '{thread_title}'"
                     )
-                    error_embed = discord.Embed(
-                        title="Error",
-                        description=f"Permission denied when trying to create thread '{thread_title}'.",
-                        color=discord.Color.red(),
+                    error_embed = _error_embed(
+                        f"Permission denied when trying to create thread '{thread_title}'."
                     )
                     await interaction.followup.send(embed=error_embed)
                     audit_log(
@@ -416,10 +566,8 @@ class Scrape(commands.Cog):
                     )
                 except discord.HTTPException as e:
                     logging.error(f"Failed to create thread '{thread_title}': {e}")
-                    error_embed = discord.Embed(
-                        title="Error",
-                        description=f"I couldn't create the thread '{thread_title}'. Please try again later.",
-                        color=discord.Color.red(),
+                    error_embed = _error_embed(
+                        f"I couldn't create the thread '{thread_title}'. Please try again later."
                     )
                     await interaction.followup.send(embed=error_embed)
                     audit_log(
@@ -427,107 +575,119 @@ class Scrape(commands.Cog):
                         f"failed to create thread '{thread_title}' in channel #{getattr(liveshows_channel, 'name', 'unknown')} (ID: {getattr(liveshows_channel, 'id', 'Unknown')}) "
                         f"due to HTTP error: {e}"
                     )
+
         audit_log(
             f"Forum threads check complete. New threads created: {new_threads_created}."
         )
         return new_threads_created
 
-    async def thread_exists(self, channel, thread_title, location):
-        """Check if a thread exists with the given title and if its starter message contains the location."""
-        norm_title = normalize_string(thread_title)
-        norm_location = normalize_string(location)
+    async def _prefetch_starter_content(self, threads):
+        """Cache the normalized starter message of each thread, fetching the missing ones concurrently."""
+        to_fetch = {}
+        for thread in threads:
+            if thread.id in self._starter_content or thread.id in to_fetch:
+                continue
+            # Use discord.py's message cache before asking the API
+            if thread.starter_message is not None:
+                self._starter_content[thread.id] = normalize_string(
+                    thread.starter_message.content
+                )
+            else:
+                to_fetch[thread.id] = thread
+        if not to_fetch:
+            return
+        results = await asyncio.gather(
+            *(thread.fetch_message(thread.id) for thread in to_fetch.values()),
+            return_exceptions=True,
+        )
+        for thread_id, result in zip(to_fetch, results):
+            # Failed fetches are left uncached; thread_exists retries and reports them
+            if isinstance(result, discord.Message):
+                self._starter_content[thread_id] = normalize_string(result.content)
+            else:
+                logging.debug(
+                    f"Prefetching starter message for thread {thread_id} failed: {result}"
+                )
+
+    async def thread_exists(
+        self, channel, norm_title, norm_location, existing_threads, event_names
+    ):
+        """
+        Check if a thread exists with the given title and if its starter message contains the location.
+        norm_title and norm_location must already be normalized with normalize_string.
+        existing_threads maps normalized thread names to the channel's threads with that name,
+        and event_names holds (normalized, original) scheduled event names built once per scrape.
+        """
         logging.debug(
             f"Checking existence for thread with normalized title '{norm_title}' and location '{norm_location}'"
         )
-        try:
-            threads = channel.threads
-            logging.debug(
-                f"Channel '{getattr(channel, 'name', 'unknown')}' has {len(threads)} active threads."
-            )
-        except Exception as e:
-            logging.error(f"Error accessing channel threads: {e}")
-            threads = []
-        for thread in threads:
-            thread_norm = normalize_string(thread.name)
-            logging.debug(
-                f"Comparing with thread: original name='{thread.name}', normalized='{thread_norm}'"
-            )
-            if thread_norm == norm_title:
-                try:
-                    starter_message = await thread.fetch_message(thread.id)
-                    message_norm = normalize_string(starter_message.content)
-                    logging.debug(
-                        f"Starter message for thread '{thread.name}' normalized to: '{message_norm}'"
-                    )
-                    if norm_location and norm_location in message_norm:
-                        logging.debug(
-                            f"Found matching location '{norm_location}' in message for thread '{thread.name}'."
-                        )
-                        audit_log(
-                            f"Thread '{thread.name}' exists with matching location '{location}'."
-                        )
-                        return True
-                except Exception as e:
-                    logging.error(
-                        f"Error fetching starter message for thread '{thread.name}': {e}"
+        for thread in existing_threads.get(norm_title, ()):
+            try:
+                message_norm = self._starter_content.get(thread.id)
+                if message_norm is None:
+                    # Use discord.py's message cache before asking the API
+                    starter_message = thread.starter_message or await thread.fetch_message(
+                        thread.id
                     )
-                    audit_log(
-                        f"Assuming thread '{thread.name}' exists due to error fetching its message."
+                    message_norm = self._starter_content[thread.id] = normalize_string(
+                        starter_message.content
                     )
-                    return True
-        # Fallback: check scheduled events for matching thread title
-        try:
-            scheduled_events = await channel.guild.fetch_scheduled_events()
-            logging.debug(
-                f"Fetched {len(scheduled_events)} scheduled events for guild '{channel.guild.name}'."
-            )
-            for event in scheduled_events:
-                normalized_event_name = normalize_string(event.name)
                 logging.debug(
-                    f"Comparing with scheduled event: original name='{event.name}', normalized='{normalized_event_name}'"
+                    f"Starter message for thread '{thread.name}' normalized to: '{message_norm}'"
                 )
-                # Use startswith to allow for extra details in scheduled event names
-                if normalized_event_name.startswith(norm_title):
+                if norm_location and norm_location in message_norm:
                     logging.debug(
-                        f"Match found in scheduled events: '{normalized_event_name}' starts with '{norm_title}'"
+                        f"Found matching location '{norm_location}' in message for thread '{thread.name}'."
                     )
                     audit_log(
-                        f"Scheduled event '{event.name}' exists with similar title to '{thread_title}'."
+                        f"Thread '{thread.name}' exists with matching location '{norm_location}'."
                     )
                     return True
-        except Exception as e:
-            logging.error(f"Error fetching scheduled events: {e}")
-            audit_log(
-                f"Error fetching scheduled events while checking thread existence: {e}"
+            except Exception as e:
+                logging.error(
+                    f"Error fetching starter message for thread '{thread.name}': {e}"
+                )
+                audit_log(
+                    f"Assuming thread '{thread.name}' exists due to error fetching its message."
+                )
+                return True
+        # Fallback: check scheduled events for matching thread title
+        for normalized_event_name, event_name in event_names:
+            logging.debug(
+                f"Comparing with scheduled event: original name='{event_name}', normalized='{normalized_event_name}'"
             )
+            # Use startswith to allow for extra details in scheduled event names
+            if normalized_event_name.startswith(norm_title):
+                logging.debug(
+                    f"Match found in scheduled events: '{normalized_event_name}' starts with '{norm_title}'"
+                )
+                audit_log(
+                    f"Scheduled event '{event_name}' exists with similar title to '{norm_title}'."
+                )
+                return True
         return False
 
-    async def check_server_events(self, guild, interaction, new_entries):
+    async def check_server_events(
+        self, guild, interaction, new_entries, scheduled_events
+    ):
         audit_log("Starting check for scheduled events for new entries.")
         new_events_created = 0
-        try:
-            with open("event-image.jpg", "rb") as img_file:
-                event_image = img_file.read()
-        except Exception as e:
-            logging.error(f"Failed to load event image: {e}")
-            audit_log(f"Failed to load event image: {e}")
-            event_image = None
+        event_image = self._event_image
+        existing_events = {normalize_string(e.name) for e in scheduled_events}
 
-        scheduled_events = await guild.fetch_scheduled_events()
-        logging.debug(
-            f"Guild '{guild.name}' has {len(scheduled_events)} scheduled events."
-        )
+        # Entries are created one at a time, in page order, so a show listed
+        # twice is only created once; discord.py's rate limiter handles any
+        # backoff Discord asks for.
         for entry in new_entries:
             # entry = (event_date, venue, location, tickets_url)
             event_date, venue, location, tickets_url = entry
-            event_name = (
-                f"{event_date.title()} - {venue.title() if venue else ''}".strip(" -")
-            )
+            venue_title = venue.title() if venue else ""
+            location_title = location.title() if location else ""
+            place = ", ".join(part for part in (venue_title, location_title) if part)
+            event_name = f"{event_date.title()} - {venue_title}".strip(" -")
             norm_event_name = normalize_string(event_name)
             logging.debug(f"Normalized scheduled event name: '{norm_event_name}'")
-            exists = any(
-                normalize_string(e.name) == norm_event_name for e in scheduled_events
-            )
+            exists = norm_event_name in existing_events
             logging.info(
                 f"Does scheduled event '{event_name}' exist in guild '{guild.name}'? {exists}"
             )
@@ -538,12 +698,8 @@ class Scrape(commands.Cog):
             if not exists:
                 start_time, end_time = self.parse_event_dates(event_date)
                 description_lines = []
-                if venue or location:
-                    description_lines.append(
-                        f"Sigrid at {venue.title() if venue else ''}{', ' if venue and location else ''}{location.title() if location else ''}".strip(
-                            ", "
-                        )
-                    )
+                if place:
+                    description_lines.append(f"Sigrid at {place}")
                 if tickets_url:
                     description_lines.append(f"Tickets: {tickets_url}")
                 description = (
@@ -556,28 +712,24 @@ class Scrape(commands.Cog):
                         description=description,
                         start_time=start_time,
                         end_time=end_time,
-                        location=f"{venue.title() if venue else ''}{', ' if venue and location else ''}{location.title() if location else ''}".strip(
-                            ", "
-                        ),
+                        location=place,
                         entity_type=discord.EntityType.external,
                         image=event_image,
                         privacy_level=discord.PrivacyLevel.guild_only,
                     )
+                    existing_events.add(norm_event_name)
                     new_events_created += 1
                     logging.info(f"Successfully created scheduled event: {event_name}")
                     audit_log(
                         f"{getattr(interaction.user, 'name', 'Unknown')} (ID: {getattr(interaction.user, 'id', 'Unknown')}) "
                         f"created scheduled event '{event_name}' in guild '{guild.name}' (ID: {guild.id})."
                     )
-                    await asyncio.sleep(2)
                 except discord.Forbidden:
                     logging.error(
                         f"Permission denied when trying to create scheduled event '{event_name}'"
                     )
-                    error_embed = discord.Embed(
-                        title="Error",
-                        description=f"Permission denied when trying to create scheduled event '{event_name}'.",
-                        color=discord.Color.red(),
+                    error_embed = _error_embed(
+                        f"Permission denied when trying to create scheduled event '{event_name}'."
                     )
                     await interaction.followup.send(embed=error_embed)
                     audit_log(
@@ -588,16 +740,15 @@ class Scrape(commands.Cog):
                     logging.error(
                         f"Failed to create scheduled event '{event_name}': {e}"
                     )
-                    error_embed = discord.Embed(
-                        title="Error",
-                        description=f"I couldn't create the event '{event_name}'. Please try again later.",
-                        color=discord.Color.red(),
+                    error_embed = _error_embed(
+                        f"I couldn't create the event '{event_name}'. Please try again later."
                     )
                     await interaction.followup.send(embed=error_embed)
                     audit_log(
                         f"{getattr(interaction.user, 'name', 'Unknown')} (ID: {getattr(interaction.user, 'id', 'Unknown')}) "
                         f"failed to create scheduled event '{event_name}' in guild '{guild.name}' (ID: {guild.id}) due to HTTP error: {e}"
                     )
+
         audit_log(
             f"Scheduled events check complete. New events created: {new_events_created}."
         )
@@ -3,10 +3,11 @@ import discord
 import logging
 import sqlite3
 import asyncio
+import threading
 from discord import app_commands
 from discord.ext import commands
-import datetime
 from typing import Optional
+from utils.audit import audit_log
 
 # Define an invisible marker for sticky messages using zero-width characters.
 STICKY_MARKER = "\u200b\u200c\u200d\u2060"
@@ -14,51 +15,59 @@ STICKY_MARKER = "\u200b\u200c\u200d\u2060"
 # How deep to scan when purging old stickies
 STICKY_PURGE_SCAN_LIMIT = 500
 
+_HEX_RE = re.compile(r"[0-9A-Fa-f]{6}")
 
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open("audit.log", "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
+# Stored as a channel's newest message ID after that message is deleted. discord.py
+# keeps channel.last_message_id pointing at the deleted message, so ask the API instead.
+_NEWEST_DELETED = 0
 
 
 def make_embed(title: str, description: str, color: discord.Color) -> discord.Embed:
     return discord.Embed(title=title, description=description, color=color)
 
 
+# Built once at import; every picker shares the same options
+_COLOUR_OPTIONS = [
+    discord.SelectOption(label="Default", value="default", description="Black (#000000)"),
+    discord.SelectOption(label="Custom Hex", value="custom_hex", description="Enter your own hex code..."),
+    discord.SelectOption(label="Random", value="random", description="Pick a random hue"),
+    discord.SelectOption(label="Teal", value="teal", description="Aloha (#1ABC9C)"),
+    discord.SelectOption(label="Dark Teal", value="dark_teal", description="Blue Green (#11806A)"),
+    discord.SelectOption(label="Green", value="green", description="UFO Green (#2ECC71)"),
+    discord.SelectOption(label="Blurple", value="blurple", description="Blue Genie (#5865F2)"),
+    discord.SelectOption(label="OG Blurple", value="og_blurple", description="Zeus' Temple (#7289DA)"),
+    discord.SelectOption(label="Blue", value="blue", description="Dayflower (#3498DB)"),
+    discord.SelectOption(label="Dark Blue", value="dark_blue", description="Deep Water (#206694)"),
+    discord.SelectOption(label="Purple", value="purple", description="Deep Lilac (#9B59B6)"),
+    discord.SelectOption(label="Dark Purple", value="dark_purple", description="Maximum Purple (#71368A)"),
+    discord.SelectOption(label="Gold", value="gold", description="Tanned Leather (#F1C40F)"),
+    discord.SelectOption(label="Dark Gold", value="dark_gold", description="Tree Sap (#C27C0E)"),
+    discord.SelectOption(label="Orange", value="orange", description="Dark Cheddar (#E67E22)"),
+    discord.SelectOption(label="Dark Orange", value="dark_orange", description="Pepperoni (#A84300)"),
+    discord.SelectOption(label="Red", value="red", description="Carmine Pink (#E74C3C)"),
+    discord.SelectOption(label="Dark Red", value="dark_red", description="Red Birch (#992D22)"),
+    discord.SelectOption(label="Greyple", value="greyple", description="Irogon Blue (#99AAB5)"),
+    discord.SelectOption(label="Light Grey", value="light_grey", description="Harrison Grey (#979C9F)"),
+    discord.SelectOption(label="Darker Grey", value="darker_grey", description="Morro Bay (#546E7A)"),
+    discord.SelectOption(label="Dark Theme", value="dark_theme", description="Antarctic Deep (transparent)"),
+    discord.SelectOption(label="Yellow", value="yellow", description="Corn (#FEE75C)"),
+]
+# Colour classmethod for each option, resolved once; unknown names fall back to default
+_COLOUR_FACTORIES = {
+    opt.value: getattr(discord.Color, opt.value, discord.Color.default)
+    for opt in _COLOUR_OPTIONS
+    if opt.value != "custom_hex"
+}
+
+
 # Colour picker reused from CustomEmbed, extended to support custom title flow
 class ColourSelect(discord.ui.Select):
     def __init__(self, parent_view: "StickyColourPickView"):
-        options = [
-            discord.SelectOption(label="Default", value="default", description="Black (#000000)"),
-            discord.SelectOption(label="Custom Hex", value="custom_hex", description="Enter your own hex code..."),
-            discord.SelectOption(label="Random", value="random", description="Pick a random hue"),
-            discord.SelectOption(label="Teal", value="teal", description="Aloha (#1ABC9C)"),
-            discord.SelectOption(label="Dark Teal", value="dark_teal", description="Blue Green (#11806A)"),
-            discord.SelectOption(label="Green", value="green", description="UFO Green (#2ECC71)"),
-            discord.SelectOption(label="Blurple", value="blurple", description="Blue Genie (#5865F2)"),
-            discord.SelectOption(label="OG Blurple", value="og_blurple", description="Zeus' Temple (#7289DA)"),
-            discord.SelectOption(label="Blue", value="blue", description="Dayflower (#3498DB)"),
-            discord.SelectOption(label="Dark Blue", value="dark_blue", description="Deep Water (#206694)"),
-            discord.SelectOption(label="Purple", value="purple", description="Deep Lilac (#9B59B6)"),
-            discord.SelectOption(label="Dark Purple", value="dark_purple", description="Maximum Purple (#71368A)"),
-            discord.SelectOption(label="Gold", value="gold", description="Tanned Leather (#F1C40F)"),
-            discord.SelectOption(label="Dark Gold", value="dark_gold", description="Tree Sap (#C27C0E)"),
-            discord.SelectOption(label="Orange", value="orange", description="Dark Cheddar (#E67E22)"),
-            discord.SelectOption(label="Dark Orange", value="dark_orange", description="Pepperoni (#A84300)"),
-            discord.SelectOption(label="Red", value="red", description="Carmine Pink (#E74C3C)"),
-            discord.SelectOption(label="Dark Red", value="dark_red", description="Red Birch (#992D22)"),
-            discord.SelectOption(label="Greyple", value="greyple", description="Irogon Blue (#99AAB5)"),
-            discord.SelectOption(label="Light Grey", value="light_grey", description="Harrison Grey (#979C9F)"),
-            discord.SelectOption(label="Darker Grey", value="darker_grey", description="Morro Bay (#546E7A)"),
-            discord.SelectOption(label="Dark Theme", value="dark_theme", description="Antarctic Deep (transparent)"),
-            discord.SelectOption(label="Yellow", value="yellow", description="Corn (#FEE75C)"),
-        ]
         super().__init__(
             placeholder="Choose an embed colour...",
             min_values=1,
             max_values=1,
-            options=options,
+            options=list(_COLOUR_OPTIONS),
         )
         self.parent_view = parent_view
 
@@ -73,11 +82,8 @@ class ColourSelect(discord.ui.Select):
                 )
             )
         else:
-            try:
-                factory = getattr(discord.Color, choice)
-                self.parent_view.chosen_colour = factory()
-            except Exception:
-                self.parent_view.chosen_colour = discord.Color.default()
+            factory = _COLOUR_FACTORIES.get(choice, discord.Color.default)
+            self.parent_view.chosen_colour = factory()
             await interaction.response.send_modal(
                 StickyModal(
                     self.parent_view.bot,
@@ -128,7 +134,7 @@ class HexContentModal(discord.ui.Modal, title="Custom HEX Sticky"):
 
     async def on_submit(self, interaction: discord.Interaction):
         hex_str = self.hex_code.value.strip().lstrip("#")
-        if not re.fullmatch(r"[0-9A-Fa-f]{6}", hex_str):
+        if not _HEX_RE.fullmatch(hex_str):
             err = make_embed("Error", "Invalid hex. Must be exactly 6 hex digits.", discord.Color.red())
             return await interaction.response.send_message(embed=err, ephemeral=True)
 
@@ -236,59 +242,128 @@ class Sticky(commands.Cog):
         self.bot = bot
         self.stickies = {}
         self.db = sqlite3.connect("database.db", check_same_thread=False)
+        # Writes run in a worker thread; the lock keeps them off the connection
+        # while another thread is using it.
+        self._db_lock = threading.Lock()
+        # WAL with synchronous=NORMAL: readers never block on writes, and a commit
+        # only fsyncs at checkpoints instead of on every sticky update.
+        self.db.execute("PRAGMA journal_mode=WAL;")
+        self.db.execute("PRAGMA synchronous=NORMAL;")
+        self.db.execute("PRAGMA temp_store=MEMORY;")
+        self.db.execute("PRAGMA cache_size=-8000;")  # ~8 MB page cache
+        self.db.execute("PRAGMA wal_autocheckpoint=1000;")
+        # Wait for other connections to database.db instead of failing with "locked"
+        self.db.execute("PRAGMA busy_timeout=5000;")
         # Ensure table and columns exist. Add title and color if missing.
-        self.db.execute(
-            "CREATE TABLE IF NOT EXISTS sticky_messages (channel_id INTEGER PRIMARY KEY, title TEXT, content TEXT, message_id INTEGER, format TEXT, color INTEGER DEFAULT 0)"
-        )
-        cols = [r[1] for r in self.db.execute("PRAGMA table_info(sticky_messages)").fetchall()]
-        if "title" not in cols:
-            self.db.execute("ALTER TABLE sticky_messages ADD COLUMN title TEXT DEFAULT ''")
-        if "color" not in cols:
-            self.db.execute("ALTER TABLE sticky_messages ADD COLUMN color INTEGER DEFAULT 0")
-        self.db.commit()
+        # One explicit transaction, so startup commits the schema once.
+        with self.db:
+            self.db.execute("BEGIN")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS sticky_messages (channel_id INTEGER PRIMARY KEY, title TEXT, content TEXT, message_id INTEGER, format TEXT, color INTEGER DEFAULT 0)"
+            )
+            cols = {r[1] for r in self.db.execute("PRAGMA table_info(sticky_messages)")}
+            if "title" not in cols:
+                self.db.execute("ALTER TABLE sticky_messages ADD COLUMN title TEXT DEFAULT ''")
+            if "color" not in cols:
+                self.db.execute("ALTER TABLE sticky_messages ADD COLUMN color INTEGER DEFAULT 0")
         self.load_stickies()
         self.initialised = False
         self.locks = {}
         self.debounce_tasks = {}
         self.debounce_interval = 1.0
+        # Each message pushes the channel's repost back by debounce_interval,
+        # but a busy channel still gets its sticky after debounce_max_wait.
+        self.debounce_max_wait = 10.0
+        self._debounce_deadline = {}
+        # Sticky rows waiting to be written, as (channel_id, row or None to delete).
+        # A single writer task drains them and commits each batch once.
+        self._write_q: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        # ID of the newest message seen per sticky channel, so an update can tell
+        # whether our sticky is still last without calling history(limit=1)
+        self._last_msg_id: dict = {}
+        # The bot's resolved permissions per channel; dropped when the channel,
+        # the bot's roles, or any role in the guild changes or is deleted
+        self._perms_cache: dict = {}
+        # Set in on_ready; compared by ID in on_message
+        self._bot_user_id: Optional[int] = None
+        # IDs of stickies the cog is deleting itself, which on_raw_message_delete ignores
+        self._self_deleting: set = set()
 
     def load_stickies(self):
-        self.stickies = {}
+        # Iterate the cursor directly so rows stream in without a fetchall() list
         cursor = self.db.execute(
             "SELECT channel_id, title, content, message_id, format, color FROM sticky_messages"
         )
-        for row in cursor.fetchall():
-            self.stickies[int(row[0])] = {
-                "title": row[1] or "",
-                "content": row[2],
-                "message_id": row[3],
-                "format": row[4],
-                "color": row[5],
+        self.stickies = {
+            int(channel_id): {
+                "title": title or "",
+                "content": content,
+                # Content with the marker appended, built once rather than per repost
+                "body": f"{content}{STICKY_MARKER}",
+                "message_id": message_id,
+                "format": fmt,
+                "color": colour,
             }
+            for channel_id, title, content, message_id, fmt, colour in cursor
+        }
 
     def update_sticky_in_db(self, channel_id: int, title: str, content: str, message_id: int, fmt: str, colour: int):
-        self.db.execute(
-            "INSERT OR REPLACE INTO sticky_messages (channel_id, title, content, message_id, format, color) VALUES (?, ?, ?, ?, ?, ?)",
-            (channel_id, title, content, message_id, fmt, colour),
-        )
-        self.db.commit()
+        """Queue the channel's sticky row for the writer task."""
+        self._write_q.put_nowait((channel_id, (channel_id, title, content, message_id, fmt, colour)))
 
     def delete_sticky_from_db(self, channel_id: int):
-        self.db.execute(
-            "DELETE FROM sticky_messages WHERE channel_id = ?", (channel_id,)
-        )
-        self.db.commit()
+        """Queue removal of the channel's sticky row for the writer task."""
+        self._write_q.put_nowait((channel_id, None))
+
+    def _write_sticky_batch(self, batch: list):
+        """Apply queued sticky changes in one transaction."""
+        # Only the newest change per channel matters
+        latest = dict(batch)
+        upserts = [row for row in latest.values() if row is not None]
+        deletes = [(channel_id,) for channel_id, row in latest.items() if row is None]
+        with self._db_lock, self.db:
+            if upserts:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO sticky_messages (channel_id, title, content, message_id, format, color) VALUES (?, ?, ?, ?, ?, ?)",
+                    upserts,
+                )
+            if deletes:
+                self.db.executemany(
+                    "DELETE FROM sticky_messages WHERE channel_id = ?", deletes
+                )
+
+    def _drain_write_queue(self) -> list:
+        batch = []
+        while not self._write_q.empty():
+            batch.append(self._write_q.get_nowait())
+        return batch
+
+    async def _db_writer(self):
+        while True:
+            batch = [await self._write_q.get()]
+            batch.extend(self._drain_write_queue())
+            try:
+                # The commit can stall on disk; keep it off the event loop
+                await asyncio.to_thread(self._write_sticky_batch, batch)
+            except Exception as e:
+                logging.error(f"Error writing sticky messages to database: {e}")
+                audit_log(f"Error writing {len(batch)} sticky change(s) to database: {e}")
 
     @staticmethod
     def _message_is_sticky(bot_user: discord.User, msg: discord.Message) -> bool:
         """Detect if a message is a sticky created by this bot."""
+        # _send_sticky always appends the marker, so only the tail needs checking
         if msg.author.id != bot_user.id:
             return False
+        marker = STICKY_MARKER
         try:
-            if msg.content and STICKY_MARKER in msg.content:
+            content = msg.content
+            if content and content.endswith(marker):
                 return True
             for emb in msg.embeds:
-                if emb.description and STICKY_MARKER in emb.description:
+                description = emb.description
+                if description and description.endswith(marker):
                     return True
         except Exception:
             return False
@@ -296,50 +371,67 @@ class Sticky(commands.Cog):
 
     async def _purge_old_stickies(self, channel: discord.TextChannel, keep_id: Optional[int] = None):
         """Delete all older sticky messages in the channel created by this bot, except keep_id."""
-        deleted = 0
-        perms = channel.permissions_for(channel.guild.me)
-        # We can always delete our own messages. Manage Messages only needed if trying to delete others.
-        async for msg in channel.history(limit=STICKY_PURGE_SCAN_LIMIT):
-            if self._message_is_sticky(self.bot.user, msg):
-                if keep_id is not None and msg.id == keep_id:
-                    continue
-                try:
-                    await msg.delete()
-                    deleted += 1
-                except discord.Forbidden:
-                    # Should not happen for own messages, but log if it does
-                    logging.warning(f"Forbidden trying to delete sticky in #{channel.name}. Check permissions.")
-                except Exception as e:
-                    logging.error(f"Error deleting old sticky in #{channel.name}: {e}")
+        bot_user = self.bot.user
+        perms = self._bot_permissions(channel)
+        # Bulk delete (up to 100 messages per request) needs Manage Messages;
+        # without it purge falls back to deleting our own messages one by one.
+        try:
+            deleted = await channel.purge(
+                limit=STICKY_PURGE_SCAN_LIMIT,
+                check=lambda m: m.id != keep_id and self._message_is_sticky(bot_user, m),
+                bulk=perms.manage_messages,
+            )
+        except discord.Forbidden:
+            # Should not happen for own messages, but log if it does
+            logging.warning(f"Forbidden trying to delete sticky in #{channel.name}. Check permissions.")
+            return
+        except discord.HTTPException as e:
+            logging.error(f"Error deleting old sticky in #{channel.name}: {e}")
+            return
         if deleted:
-            audit_log(f"Purged {deleted} old sticky messages in #{channel.name}.")
+            audit_log(f"Purged {len(deleted)} old sticky messages in #{channel.name}.")
 
     async def update_sticky_for_channel(self, channel: discord.abc.Messageable, sticky: dict, force_update: bool = False):
         if not isinstance(channel, discord.TextChannel):
             logging.warning(f"Channel {channel} is not a TextChannel. Skipping sticky update.")
             return
 
-        perms = channel.permissions_for(channel.guild.me)
+        perms = self._bot_permissions(channel)
         if not perms.send_messages:
             logging.warning(f"Missing Send Messages in #{channel.name}. Cannot update sticky.")
             return
 
-        lock = self.locks.setdefault(channel.id, asyncio.Lock())
+        # setdefault would build a new Lock on every call just to throw it away
+        lock = self.locks.get(channel.id)
+        if lock is None:
+            lock = self.locks[channel.id] = asyncio.Lock()
         async with lock:
             # Check most recent message to avoid unnecessary reposts
-            try:
-                latest: Optional[discord.Message] = None
-                async for m in channel.history(limit=1):
-                    latest = m
-                    break
-            except Exception as e:
-                logging.error(f"Failed to fetch latest message in #{channel.name}: {e}")
-                latest = None
+            if not force_update:
+                latest_sticky_id: Optional[int] = None
+                latest_id = self._last_msg_id.get(channel.id)
+                if latest_id is None:
+                    # Not seen since (re)connecting: discord.py has it from the gateway
+                    latest_id = channel.last_message_id
+                elif latest_id == _NEWEST_DELETED:
+                    latest_id = None
+                if latest_id is not None:
+                    if latest_id == sticky.get("message_id"):
+                        latest_sticky_id = latest_id
+                else:
+                    # Channel state has no last message either, so ask the API
+                    try:
+                        async for m in channel.history(limit=1):
+                            self._note_latest(channel.id, m.id)
+                            if self._message_is_sticky(self.bot.user, m):
+                                latest_sticky_id = m.id
+                            break
+                    except Exception as e:
+                        logging.error(f"Failed to fetch latest message in #{channel.name}: {e}")
 
-            if latest and not force_update:
                 # If the latest message is our sticky, just purge older ones and exit
-                if self._message_is_sticky(self.bot.user, latest):
-                    await self._purge_old_stickies(channel, keep_id=latest.id)
+                if latest_sticky_id is not None:
+                    await self._purge_old_stickies(channel, keep_id=latest_sticky_id)
                     return
 
             # Otherwise delete the previous tracked sticky if it exists, then send a new one
@@ -347,7 +439,7 @@ class Sticky(commands.Cog):
                 if sticky.get("message_id"):
                     try:
                         old_message = await channel.fetch_message(int(sticky["message_id"]))
-                        await old_message.delete()
+                        await self._delete_own_message(old_message)
                     except discord.NotFound:
                         pass
                     except Exception as e:
@@ -356,11 +448,13 @@ class Sticky(commands.Cog):
                 fmt = sticky.get("format", "normal")
                 colour = sticky.get("color", discord.Color.blurple().value)
                 title = sticky.get("title", "") or ""
-                new_sticky = await self._send_sticky(channel, title, sticky["content"], fmt, colour)
+                new_sticky = await self._send_sticky(channel, title, sticky["body"], fmt, colour)
+                self._note_latest(channel.id, new_sticky.id)
 
                 self.stickies[channel.id] = {
                     "title":     title,
                     "content":   sticky["content"],
+                    "body":      sticky["body"],
                     "message_id": new_sticky.id,
                     "format":    fmt,
                     "color":     colour,
@@ -373,26 +467,58 @@ class Sticky(commands.Cog):
             except Exception as e:
                 logging.error(f"Error updating sticky in channel #{channel.name}: {e}")
 
-    async def _debounced_update(self, channel: discord.abc.Messageable, sticky: dict):
+    async def _delete_own_message(self, message: discord.Message):
+        self._self_deleting.add(message.id)
+        try:
+            await message.delete()
+        except Exception:
+            # No delete event will arrive for it
+            self._self_deleting.discard(message.id)
+            raise
+
+    def _bot_permissions(self, channel: discord.TextChannel) -> discord.Permissions:
+        perms = self._perms_cache.get(channel.id)
+        if perms is None:
+            perms = self._perms_cache[channel.id] = channel.permissions_for(channel.guild.me)
+        return perms
+
+    def _note_latest(self, channel_id: int, message_id: int):
+        # Snowflakes grow over time; a late write must not hide a newer message
+        if message_id > self._last_msg_id.get(channel_id, 0):
+            self._last_msg_id[channel_id] = message_id
+
+    async def _debounced_update(self, channel: discord.abc.Messageable):
+        loop = asyncio.get_running_loop()
+        give_up_at = loop.time() + self.debounce_max_wait
         try:
-            await asyncio.sleep(self.debounce_interval)
-            await self.update_sticky_for_channel(channel, sticky, force_update=False)
+            # Sleep until the channel has been quiet for debounce_interval
+            while True:
+                deadline = min(self._debounce_deadline.get(channel.id, 0.0), give_up_at)
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(remaining)
+            sticky = self.stickies.get(channel.id)
+            if sticky is not None:
+                await self.update_sticky_for_channel(channel, sticky, force_update=False)
         finally:
             self.debounce_tasks.pop(channel.id, None)
+            self._debounce_deadline.pop(channel.id, None)
 
-    async def _send_sticky(self, channel: discord.TextChannel, title: str, content: str, fmt: str, colour_value: int):
+    async def _send_sticky(self, channel: discord.TextChannel, title: str, body: str, fmt: str, colour_value: int):
+        """Send a sticky. body is the content with STICKY_MARKER already appended."""
         if fmt == "embed":
             embed = discord.Embed(
                 title=title or "Sticky Message",
-                description=f"{content}{STICKY_MARKER}",
+                description=body,
                 color=discord.Color(colour_value)
             )
             return await channel.send(embed=embed)
         else:
-            return await channel.send(f"{content}{STICKY_MARKER}")
+            return await channel.send(body)
 
     async def create_or_replace_sticky(self, interaction: discord.Interaction, channel: discord.TextChannel, title: str, content: str, fmt: str, colour: discord.Color):
-        perms = channel.permissions_for(interaction.guild.me)
+        perms = self._bot_permissions(channel)
         if not perms.send_messages:
             err = make_embed("Error", "I do not have permission to send messages in this channel.", discord.Color.red())
             return await interaction.response.send_message(embed=err, ephemeral=True)
@@ -409,17 +535,20 @@ class Sticky(commands.Cog):
                 pass
 
         # Send new sticky
+        body = f"{content}{STICKY_MARKER}"
         if fmt == "embed":
-            sent = await self._send_sticky(channel, title, content, "embed", colour.value)
+            sent = await self._send_sticky(channel, title, body, "embed", colour.value)
             colour_value = colour.value
         else:
-            sent = await self._send_sticky(channel, "", content, "normal", 0)
+            sent = await self._send_sticky(channel, "", body, "normal", 0)
             colour_value = 0
+        self._note_latest(channel.id, sent.id)
 
         # Save memory and DB
         self.stickies[channel.id] = {
             "title":      title if fmt == "embed" else "",
             "content":    content,
+            "body":       body,
             "message_id": sent.id,
             "format":     fmt,
             "color":      colour_value,
@@ -433,48 +562,104 @@ class Sticky(commands.Cog):
         await interaction.response.send_message(embed=ok, ephemeral=True)
         audit_log(f"{interaction.user} set a '{fmt}' sticky in #{channel.name}.")
 
+    def _drop_lock(self, channel_id: int):
+        """Forget a channel's update lock, unless an update is still holding it."""
+        lock = self.locks.get(channel_id)
+        if lock is not None and not lock.locked():
+            del self.locks[channel_id]
+
+    async def _update_all_stickies(self):
+        # Channels are independent, so update them concurrently; discord.py's
+        # per-route rate limiting still paces the requests.
+        updates = []
+        for channel_id, sticky in list(self.stickies.items()):
+            channel = self.bot.get_channel(int(channel_id))
+            if channel:
+                updates.append(self.update_sticky_for_channel(channel, sticky, force_update=False))
+        results = await asyncio.gather(*updates, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logging.error(f"Error updating sticky: {result}")
+
     @commands.Cog.listener()
     async def on_ready(self):
         logging.info("\033[96mSticky\033[0m cog synced successfully.")
         audit_log("Sticky cog synced successfully.")
-        for channel_id, sticky in list(self.stickies.items()):
-            channel = self.bot.get_channel(int(channel_id))
-            if channel:
-                await self.update_sticky_for_channel(channel, sticky, force_update=False)
+        self._bot_user_id = self.bot.user.id
+        # Messages may have arrived while disconnected
+        self._last_msg_id.clear()
+        await self._update_all_stickies()
         self.initialised = True
 
     @commands.Cog.listener()
     async def on_resumed(self):
         logging.info("Bot resumed. Updating sticky messages in all channels.")
         audit_log("Bot resumed: Updating sticky messages in all channels.")
-        for channel_id, sticky in list(self.stickies.items()):
-            channel = self.bot.get_channel(int(channel_id))
-            if channel:
-                await self.update_sticky_for_channel(channel, sticky, force_update=False)
+        self._last_msg_id.clear()
+        await self._update_all_stickies()
         self.initialised = True
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
-        if message.author == self.bot.user:
-            return
+        # Runs for every message the bot sees, so bail out early and look up once
         channel = message.channel
-        if channel.id in self.stickies:
-            if channel.id in self.debounce_tasks:
-                return
-            self.debounce_tasks[channel.id] = self.bot.loop.create_task(
-                self._debounced_update(channel, self.stickies[channel.id])
-            )
+        channel_id = channel.id
+        if channel_id not in self.stickies:
+            return
+        self._note_latest(channel_id, message.id)
+        if message.author.id == self._bot_user_id:
+            return
+        self._debounce_deadline[channel_id] = asyncio.get_running_loop().time() + self.debounce_interval
+        debounce_tasks = self.debounce_tasks
+        if channel_id in debounce_tasks:
+            return
+        debounce_tasks[channel_id] = self.bot.loop.create_task(
+            self._debounced_update(channel)
+        )
 
     @commands.Cog.listener()
-    async def on_message_delete(self, message: discord.Message):
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        # Raw event, so deletes are seen even when the message has left discord.py's cache
+        channel_id = payload.channel_id
+        # The newest message is gone; the next update falls back to history(limit=1)
+        if self._last_msg_id.get(channel_id) == payload.message_id:
+            self._last_msg_id[channel_id] = _NEWEST_DELETED
+        # The cog deleted this one itself while replacing or removing the sticky
+        if payload.message_id in self._self_deleting:
+            self._self_deleting.discard(payload.message_id)
+            return
         # If the bot's sticky was manually deleted, cancel pending debounce and re-post immediately
-        if message.author == self.bot.user and message.channel.id in self.stickies:
-            sticky = self.stickies[message.channel.id]
-            if message.id == sticky.get("message_id"):
-                task = self.debounce_tasks.pop(message.channel.id, None)
-                if task:
-                    task.cancel()
-                await self.update_sticky_for_channel(message.channel, sticky, force_update=True)
+        sticky = self.stickies.get(channel_id)
+        if sticky is not None and payload.message_id == sticky.get("message_id"):
+            task = self.debounce_tasks.pop(channel_id, None)
+            if task:
+                task.cancel()
+            channel = self.bot.get_channel(channel_id)
+            if channel:
+                await self.update_sticky_for_channel(channel, sticky, force_update=True)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        self._perms_cache.pop(after.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self._perms_cache.pop(channel.id, None)
+        self._drop_lock(channel.id)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if after.id == self.bot.user.id and before.roles != after.roles:
+            self._perms_cache.clear()
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.permissions != after.permissions:
+            self._perms_cache.clear()
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._perms_cache.clear()
 
     @app_commands.command(name="setsticky", description="Set a sticky message in the channel.")
     async def set_sticky(self, interaction: discord.Interaction):
@@ -497,16 +682,33 @@ class Sticky(commands.Cog):
 
         try:
             old_msg = await channel.fetch_message(int(self.stickies[channel.id].get("message_id", 0)))
-            await old_msg.delete()
+            await self._delete_own_message(old_msg)
         except Exception:
             pass
         self.delete_sticky_from_db(channel.id)
         self.stickies.pop(channel.id, None)
+        self._last_msg_id.pop(channel.id, None)
+        self._drop_lock(channel.id)
 
         ok = make_embed("Sticky Removed", f"Removed sticky from {channel.mention}.", discord.Color.green())
         await interaction.response.send_message(embed=ok, ephemeral=True)
         audit_log(f"{interaction.user} removed sticky in #{channel.name}.")
 
+    async def cog_load(self):
+        # Runs once per load, so reconnects never start a second writer
+        self._writer_task = asyncio.create_task(self._db_writer(), name="sticky_db_writer")
+
+    def cog_unload(self):
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+        # Write whatever the task had not picked up yet
+        batch = self._drain_write_queue()
+        if batch:
+            try:
+                self._write_sticky_batch(batch)
+            except Exception as e:
+                logging.error(f"Error writing sticky messages to database on unload: {e}")
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Sticky(bot))
@@ -1,19 +1,13 @@
 import discord
 import logging
-import yaml
 from discord import app_commands
 from discord.ext import commands
 import aiohttp
 import asyncio
-from datetime import datetime
+import types
 from typing import Dict, Any, Optional
-
-
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open("audit.log", "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
+from utils.audit import audit_log
+from utils.config_cache import load_yaml_cached
 
 
 def colour_from_value(value: Optional[str], fallback: discord.Color) -> discord.Color:
@@ -39,12 +33,58 @@ class TrackDetails(commands.Cog):
     a formatted platform list and link buttons.
     """
 
+    # Platform order used when config.yaml does not set songlink.platform_order
+    DEFAULT_ORDER = (
+        "spotify",
+        "appleMusic",
+        "youtube",
+        "youtubeMusic",
+        "itunes",
+        "amazonMusic",
+        "amazonStore",
+        "deezer",
+        "tidal",
+        "soundcloud",
+        "boomplay",
+        "gaana",
+        "saavn",
+    )
+
+    # Mapping of platform keys to friendly names (no emojis now)
+    PLATFORM_MAP = types.MappingProxyType(
+        {
+            "spotify": "Spotify",
+            "appleMusic": "Apple Music",
+            "youtube": "YouTube",
+            "itunes": "iTunes",
+            "amazonMusic": "Amazon Music",
+            "deezer": "Deezer",
+            "tidal": "TIDAL",
+            "soundcloud": "SoundCloud",
+        }
+    )
+
+    # Platforms to exclude
+    EXCLUDED_PLATFORMS = frozenset(
+        {
+            "audiomack",
+            "anghami",
+            "napster",
+            "pandora",
+            "yandex",
+            "boomplay",
+            "gaana",
+            "saavn",
+            "amazonStore",
+            "youtubeMusic",
+        }
+    )
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
         try:
-            with open("config.yaml", "r", encoding="utf-8") as f:
-                self.config: Dict[str, Any] = yaml.safe_load(f) or {}
+            self.config: Dict[str, Any] = load_yaml_cached("config.yaml") or {}
         except Exception:
             self.config = {}
 
@@ -53,24 +93,12 @@ class TrackDetails(commands.Cog):
             "base_url", "https://api.song.link/v1-alpha.1/links"
         )
         self.timeout_seconds: int = int(api_cfg.get("timeout_seconds", 12))
-        self.common_platform_order = api_cfg.get(
-            "platform_order",
-            [
-                "spotify",
-                "appleMusic",
-                "youtube",
-                "youtubeMusic",
-                "itunes",
-                "amazonMusic",
-                "amazonStore",
-                "deezer",
-                "tidal",
-                "soundcloud",
-                "boomplay",
-                "gaana",
-                "saavn",
-            ],
-        )
+        self.common_platform_order = api_cfg.get("platform_order", self.DEFAULT_ORDER)
+
+        # Position of each platform in the preferred order, for sorting
+        self._order_rank: Dict[str, int] = {}
+        for i, platform in enumerate(self.common_platform_order):
+            self._order_rank.setdefault(platform, i)
 
         colours_cfg = self.config.get("colours", {})
         self.success_colour = colour_from_value(
@@ -83,34 +111,23 @@ class TrackDetails(commands.Cog):
             colours_cfg.get("error", "#ED4245"), discord.Color.red()
         )
 
-        # Mapping of platform keys to friendly names (no emojis now)
-        self.platform_map: Dict[str, str] = {
-            "spotify": "Spotify",
-            "appleMusic": "Apple Music",
-            "youtube": "YouTube",
-            "itunes": "iTunes",
-            "amazonMusic": "Amazon Music",
-            "deezer": "Deezer",
-            "tidal": "TIDAL",
-            "soundcloud": "SoundCloud",
-        }
-
-        # Platforms to exclude
-        self.excluded_platforms = {
-            "audiomack",
-            "anghami",
-            "napster",
-            "pandora",
-            "yandex",
-            "boomplay",
-            "gaana",
-            "saavn",
-            "amazonStore",
-            "youtubeMusic",
-        }
+        # Keep-alive session reused across /track calls, so repeat lookups skip
+        # the TCP and TLS handshakes. Created on first use inside the event loop.
+        self._session: Optional[aiohttp.ClientSession] = None
 
         audit_log("TrackDetails cog initialised and configuration loaded successfully.")
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+            )
+        return self._session
+
+    async def cog_unload(self):
+        if self._session is not None:
+            await self._session.close()
+
     @commands.Cog.listener()
     async def on_ready(self):
         logging.info("\033[96mTrackDetails\033[0m cog synced successfully.")
@@ -180,17 +197,12 @@ class TrackDetails(commands.Cog):
         links_by_platform: Dict[str, Dict[str, Any]] = (
             data.get("linksByPlatform", {}) or {}
         )
-        available_platforms = [
-            p for p in links_by_platform.keys() if p not in self.excluded_platforms
-        ]
-
-        if available_platforms:
-            ordered_platforms = sorted(
-                available_platforms,
-                key=lambda p: self._order_key(p, available_platforms),
-            )
+        # Ordered once; used for both the embed field and the link buttons
+        ordered_platforms = self._ordered_platforms(links_by_platform)
+
+        if ordered_platforms:
             formatted_list = ", ".join(
-                self.platform_map.get(p, p.replace("_", " ").title())
+                self.PLATFORM_MAP.get(p, p.replace("_", " ").title())
                 for p in ordered_platforms
             )
             embed.add_field(name="Available on", value=formatted_list, inline=False)
@@ -206,9 +218,9 @@ class TrackDetails(commands.Cog):
 
         if details.get("platforms"):
             detected = [
-                self.platform_map.get(p, p.replace("_", " ").title())
+                self.PLATFORM_MAP.get(p, p.replace("_", " ").title())
                 for p in details.get("platforms")
-                if p not in self.excluded_platforms
+                if p not in self.EXCLUDED_PLATFORMS
             ]
             embed.add_field(
                 name="Detected platform",
@@ -216,7 +228,7 @@ class TrackDetails(commands.Cog):
                 inline=False,
             )
 
-        view = self.build_platform_buttons(links_by_platform)
+        view = self.build_platform_buttons(links_by_platform, ordered_platforms)
 
         try:
             await interaction.followup.send(embed=embed, view=view if view else None)
@@ -230,45 +242,40 @@ class TrackDetails(commands.Cog):
                 interaction, f"Failed to send the track details: `{e}`"
             )
 
-    def _order_key(self, platform_key: str, available_platforms: list) -> int:
-        if platform_key in self.common_platform_order:
-            return self.common_platform_order.index(platform_key)
-        return len(self.common_platform_order) + available_platforms.index(platform_key)
-
     async def fetch_json(self, url: str, timeout: int = 10) -> Optional[Dict[str, Any]]:
         timeout_cfg = aiohttp.ClientTimeout(total=timeout)
-        async with aiohttp.ClientSession(timeout=timeout_cfg) as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    logging.error(
-                        f"Songlink API responded with status {resp.status}: {text[:200]}"
-                    )
-                    raise RuntimeError(f"API status {resp.status}")
-                return await resp.json()
+        async with self._get_session().get(url, timeout=timeout_cfg) as resp:
+            if resp.status != 200:
+                text = await resp.text()
+                logging.error(
+                    f"Songlink API responded with status {resp.status}: {text[:200]}"
+                )
+                raise RuntimeError(f"API status {resp.status}")
+            return await resp.json()
 
-    def build_platform_buttons(
+    def _ordered_platforms(
         self, links_by_platform: Dict[str, Dict[str, Any]]
+    ) -> list:
+        """Non-excluded platforms: preferred ones first, then the rest in the API's order."""
+        order_rank = self._order_rank
+        extras_base = len(self.common_platform_order)
+        api_position = {p: i for i, p in enumerate(links_by_platform)}
+        # Set difference against the frozenset; the sort key restores the order
+        return sorted(
+            links_by_platform.keys() - self.EXCLUDED_PLATFORMS,
+            key=lambda p: order_rank.get(p, extras_base + api_position[p]),
+        )
+
+    def build_platform_buttons(
+        self, links_by_platform: Dict[str, Dict[str, Any]], ordered_platforms: list
     ) -> Optional[discord.ui.View]:
         if not links_by_platform:
             return None
 
-        ordered = [
-            p
-            for p in self.common_platform_order
-            if p in links_by_platform and p not in self.excluded_platforms
-        ]
-        extras = [
-            p
-            for p in links_by_platform.keys()
-            if p not in ordered and p not in self.excluded_platforms
-        ]
-        final_order = ordered + extras
-
         view = discord.ui.View()
         buttons_added = 0
 
-        for platform in final_order:
+        for platform in ordered_platforms:
             platform_info = links_by_platform.get(platform) or {}
             url = platform_info.get("url")
             if not url:
@@ -287,8 +294,8 @@ class TrackDetails(commands.Cog):
         return view if buttons_added > 0 else None
 
     def pretty_platform_name(self, key: str) -> str:
-        if key in self.platform_map:
-            return self.platform_map[key]
+        if key in self.PLATFORM_MAP:
+            return self.PLATFORM_MAP[key]
         return key.replace("_", " ").title()
 
     async def send_error(self, interaction: discord.Interaction, message: str):
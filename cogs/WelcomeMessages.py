@@ -1,29 +1,36 @@
 import discord
+import io
 import logging
-import yaml
+from typing import Optional
 from discord.ext import commands
-import datetime
-
-
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open("audit.log", "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
+from utils.audit import audit_log
+from utils.config_cache import load_yaml_cached
 
 
 class Welcome(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         # Load the config file (UTF-8 for special characters)
-        with open("config.yaml", "r", encoding="utf-8") as config_file:
-            self.config = yaml.safe_load(config_file)
+        self.config = load_yaml_cached("config.yaml")
         # Get the welcome channel ID and check if welcome messages are enabled.
         self.welcome_channel_id = self.config.get("welcome_channel_id")
         self.new_member_channel_id = self.config.get("new_member_channel_id")
         self.welcome_enabled = self.config.get("welcome_enabled", True)
         # Set the local welcome image path
         self.welcome_image_path = "welcome-image.jpg"
+        # Read once; every join sends the same bytes
+        try:
+            with open(self.welcome_image_path, "rb") as img_file:
+                self._welcome_image: Optional[bytes] = img_file.read()
+        except OSError as e:
+            logging.error(f"Failed to load welcome image: {e}")
+            audit_log(f"Failed to load welcome image: {e}")
+            self._welcome_image = None
+        # Parts of the welcome embed that are the same for every member
+        self._welcome_embed = discord.Embed(
+            title="Welcome to the Official Sigrid Community!",
+            color=discord.Color.yellow(),
+        )
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -51,38 +58,38 @@ class Welcome(commands.Cog):
             )
             return
 
-        embed = discord.Embed(
-            title="Welcome to the Official Sigrid Community!",
-            description=(
-                f"Hey {member.mention}, welcome to the home of Sigrid! 🌟\n"
-                f"Make sure to check out <#{self.new_member_channel_id}> to find your way around! 🎶"
-            ),
-            color=discord.Color.yellow(),
+        embed = self._welcome_embed.copy()
+        embed.description = (
+            f"Hey {member.mention}, welcome to the home of Sigrid! 🌟\n"
+            f"Make sure to check out <#{self.new_member_channel_id}> to find your way around! 🎶"
         )
 
-        embed.set_image(url="attachment://welcome-image.jpg")
+        if self._welcome_image is None:
+            logging.error(
+                f"Welcome image not found at path '{self.welcome_image_path}'. Sending embed without image."
+            )
+            audit_log(
+                f"Welcome image missing at '{self.welcome_image_path}'. Sent embed without image for {member.name} in guild '{guild.name}'."
+            )
+        else:
+            embed.set_image(url="attachment://welcome-image.jpg")
 
         try:
-            await channel.send(
-                embed=embed,
-                file=discord.File(
-                    self.welcome_image_path, filename="welcome-image.jpg"
-                ),
-            )
+            if self._welcome_image is None:
+                await channel.send(embed=embed)
+            else:
+                await channel.send(
+                    embed=embed,
+                    file=discord.File(
+                        io.BytesIO(self._welcome_image), filename="welcome-image.jpg"
+                    ),
+                )
             logging.info(
                 f"Welcome embed sent for '{member.name}' in channel #{channel.name}."
             )
             audit_log(
                 f"Sent welcome message for {member.name} (ID: {member.id}) in channel #{channel.name} (ID: {channel.id}) in guild '{guild.name}' (ID: {guild.id})."
             )
-        except FileNotFoundError:
-            logging.error(
-                f"Welcome image not found at path '{self.welcome_image_path}'. Sending embed without image."
-            )
-            audit_log(
-                f"Welcome image missing at '{self.welcome_image_path}'. Sent embed without image for {member.name} in guild '{guild.name}'."
-            )
-            await channel.send(embed=embed)
         except discord.HTTPException as e:
             logging.error(
                 f"Error sending welcome embed in channel #{channel.name} (ID: {channel.id}): {e}"
@@ -2,25 +2,44 @@ import discord
 import logging
 from discord import app_commands
 from discord.ext import commands
-import datetime
-from typing import Optional
-
-
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open("audit.log", "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
+from typing import Any, Dict, List, Optional
+from utils.audit import audit_log
 
 
 class Help(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # The command tree does not change once every cog is loaded, so it is
+        # walked once rather than on every /help
+        self._cmd_list: List[Any] = []
+        self._cmd_by_name: Dict[str, Any] = {}
+        self._list_embed_dict: Dict[str, Any] = {}
+
+    def _cache_commands(self):
+        self._cmd_list = list(self.bot.tree.walk_commands())
+        self._cmd_by_name = {}
+        for cmd in self._cmd_list:
+            self._cmd_by_name.setdefault(cmd.name.lower(), cmd)
+
+        # The full command list is the same for everyone, so build its embed once
+        embed = discord.Embed(
+            title="List of Commands:",
+            description="Use `/help [command]` to see detailed info about a command.",
+            color=discord.Color.blurple(),
+        )
+        for cmd in self._cmd_list:
+            cmd_name = cmd.name
+            cmd_desc = (
+                cmd.description if cmd.description else "No description available."
+            )
+            embed.add_field(name=cmd_name, value=cmd_desc, inline=False)
+        self._list_embed_dict = embed.to_dict()
 
     @commands.Cog.listener()
     async def on_ready(self):
         logging.info("\033[96mHelp\033[0m cog synced successfully.")
         audit_log("Help cog synced successfully.")
+        self._cache_commands()
 
     @app_commands.command(
         name="help",
@@ -33,19 +52,12 @@ class Help(commands.Cog):
         self, interaction: discord.Interaction, command: Optional[str] = None
     ):
         # Do not defer response to avoid delay; this command should respond immediately.
+        if not self._cmd_list:
+            # Loaded after on_ready, e.g. on a reload
+            self._cache_commands()
         if command is None:
-            # Build a list of all commands.
-            embed = discord.Embed(
-                title="List of Commands:",
-                description="Use `/help [command]` to see detailed info about a command.",
-                color=discord.Color.blurple(),
-            )
-            for cmd in self.bot.tree.walk_commands():
-                cmd_name = cmd.name
-                cmd_desc = (
-                    cmd.description if cmd.description else "No description available."
-                )
-                embed.add_field(name=cmd_name, value=cmd_desc, inline=False)
+            # List of all commands, from the embed built in _cache_commands
+            embed = discord.Embed.from_dict(self._list_embed_dict)
             try:
                 await interaction.response.send_message(embed=embed, ephemeral=True)
             except discord.NotFound:
@@ -55,11 +67,7 @@ class Help(commands.Cog):
             )
         else:
             # Search for the command (case-insensitive)
-            found_command = None
-            for cmd in self.bot.tree.walk_commands():
-                if cmd.name.lower() == command.lower():
-                    found_command = cmd
-                    break
+            found_command = self._cmd_by_name.get(command.lower())
 
             if found_command:
                 embed = discord.Embed(
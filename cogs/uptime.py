@@ -3,20 +3,16 @@ import logging
 import time
 from discord import app_commands
 from discord.ext import commands
-import datetime
+from utils.audit import audit_log
 
-
-def audit_log(message: str):
-    """Append a timestamped message to the audit log file."""
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open("audit.log", "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
+_UPTIME_COLOUR = discord.Color.green()
 
 
 class Uptime(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.start_time = time.time()  # Record the bot's start time
+        # Monotonic clock, so a system clock change does not skew the uptime
+        self.start_time = time.monotonic()
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -27,7 +23,7 @@ class Uptime(commands.Cog):
         name="uptime", description="Shows how long the bot has been running."
     )
     async def uptime(self, interaction: discord.Interaction):
-        uptime_seconds = int(time.time() - self.start_time)
+        uptime_seconds = int(time.monotonic() - self.start_time)
         days, remainder = divmod(uptime_seconds, 86400)
         hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
@@ -41,7 +37,7 @@ class Uptime(commands.Cog):
         embed = discord.Embed(
             title="Bot Uptime",
             description=f"The bot has been running for: `{uptime_str}`",
-            color=discord.Color.green(),
+            color=_UPTIME_COLOUR,
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -2,11 +2,11 @@ import discord
 from discord.ext import commands, tasks
 import random
 import os
-import yaml
 import asyncio
 import logging
 from dotenv import load_dotenv
-import datetime
+from utils.audit import audit_log
+from utils.config_cache import load_yaml_cached
 
 # Load environment variables from .env file
 load_dotenv()
@@ -23,12 +23,18 @@ class CustomFormatter(logging.Formatter):
     }
     RESET_COLOUR = "\033[0m"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Coloured level names built once instead of concatenated per record
+        self._level_names = {
+            level: colour + logging.getLevelName(level) + self.RESET_COLOUR
+            for level, colour in self.LEVEL_COLOURS.items()
+        }
+
     def format(self, record):
-        level_name = (
-            self.LEVEL_COLOURS.get(record.levelno, self.RESET_COLOUR)
-            + record.levelname
-            + self.RESET_COLOUR
-        )
+        level_name = self._level_names.get(record.levelno)
+        if level_name is None:
+            level_name = self.RESET_COLOUR + record.levelname + self.RESET_COLOUR
         record.levelname = level_name
         return super().format(record)
 
@@ -42,16 +48,9 @@ handler.setFormatter(formatter)
 logging.basicConfig(level=logging.INFO, handlers=[handler])
 
 
-# Audit log function to write events to audit.log
-def audit_log(message: str):
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open("audit.log", "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
-
-
 # Load the config file (UTF-8 for emojis, etc.)
-with open("config.yaml", "r", encoding="utf-8") as config_file:
-    config = yaml.safe_load(config_file)
+# Parsed through the shared cache, so the cogs loading it next skip the parse
+config = load_yaml_cached("config.yaml")
 
 # Retrieve the bot token from the .env file
 BOT_TOKEN = os.environ.get("TOKEN")
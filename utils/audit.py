@@ -0,0 +1,45 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+
+class _AuditListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry."""
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            # End of a burst: write out what has been buffered, then wait
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+
+# Shared by every cog that imports audit_log from here. audit.log stays open,
+# and entries are buffered until a burst of them ends (or 256 pile up),
+# rather than reopening the file for every line.
+_audit_file_handler = logging.FileHandler("audit.log", encoding="utf-8", delay=True)
+_audit_file_handler.setFormatter(
+    logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+)
+_audit_buffer = logging.handlers.MemoryHandler(
+    capacity=256, flushLevel=logging.ERROR, target=_audit_file_handler
+)
+# audit_log() only enqueues the record; the listener thread does the disk writes,
+# so callers on the event loop never wait for the file.
+_audit_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_audit_listener = _AuditListener(_audit_queue, _audit_buffer)
+_audit_listener.start()
+_audit_logger = logging.getLogger("audit")
+_audit_logger.setLevel(logging.INFO)
+_audit_logger.propagate = False
+_audit_logger.addHandler(logging.handlers.QueueHandler(_audit_queue))
+# Drain the queue at exit; logging's own shutdown hook then flushes the buffer
+atexit.register(_audit_listener.stop)
+
+
+def audit_log(message: str):
+    """Append a timestamped message to the audit log file."""
+    _audit_logger.info(message)
@@ -0,0 +1,37 @@
+import copy
+import os
+from collections import OrderedDict
+from typing import Any, Tuple
+
+import yaml
+
+# libyaml's C loader when PyYAML was built with it; same safe subset as SafeLoader
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Most recently used last; each entry is path -> (mtime_ns, size, parsed)
+_MAX_ENTRIES = 100
+_cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+
+
+def load_yaml_cached(path: str) -> Any:
+    """
+    Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    The file's mtime and size are checked on every call, so an edited file is
+    parsed again. Callers get their own deep copy and may modify it freely.
+    Raises the same errors as opening and parsing the file directly.
+    """
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    entry = _cache.get(key)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        _cache.move_to_end(key)
+        return copy.deepcopy(entry[2])
+
+    with open(path, "r", encoding="utf-8") as f:
+        parsed = yaml.load(f, Loader=_LOADER)
+    _cache[key] = (st.st_mtime_ns, st.st_size, parsed)
+    _cache.move_to_end(key)
+    if len(_cache) > _MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return copy.deepcopy(parsed)